@@ -1,47 +1,270 @@
+if __name__ == '__main__':
+    # Patch sockets before anything imports them, so outbound requests calls
+    # yield to other greenlets instead of blocking the whole server
+    from gevent import monkey
+    monkey.patch_all()
+
+import hmac
+import os
+import threading
+from functools import wraps
+from typing import Callable, Optional, Union
+
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from flask import Flask, jsonify, make_response, Response, request
+from flask import Flask, Response, current_app, request
+from flask.json.provider import JSONProvider
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import delete
+from sqlalchemy.pool import StaticPool
+from werkzeug.exceptions import HTTPException
 # from flask_cors import CORS
 
 from config import ProductionConfig
 
-from boxing.db import db
+from boxing.db import db, truncate_table
 from boxing.models.boxers_model import Boxers
 from boxing.models.ring_model import RingModel
 from boxing.models.user_model import Users
 from boxing.utils.logger import configure_logger
+from boxing.utils.schemas import BoxerIn, Credentials, NewPassword
 
 
 load_dotenv()
 
+
+# Bodies of constant responses, serialized once at import time. A fresh Response
+# is still built per request so headers and cookies never leak between responses.
+AUTH_REQUIRED = orjson.dumps({"status": "error", "message": "Authentication required"})
+USERNAME_AND_PASSWORD_REQUIRED = orjson.dumps({"status": "error", "message": "Username and password are required"})
+INVALID_CREDENTIALS = orjson.dumps({"status": "error", "message": "Invalid username or password"})
+NEW_PASSWORD_REQUIRED = orjson.dumps({"status": "error", "message": "New password is required"})
+SERVICE_RUNNING = orjson.dumps({"status": "success", "message": "Service is running"})
+LOGGED_OUT = orjson.dumps({"status": "success", "message": "User logged out successfully"})
+INTERNAL_ERROR = orjson.dumps({"status": "error", "message": "An internal error occurred"})
+
+# Sort fields accepted by the leaderboard route
+VALID_SORT_FIELDS = frozenset({'wins', 'win_pct'})
+
+
+def json_response(body: Union[dict, bytes], status: int = 200) -> Response:
+    """Build a JSON response, serializing the body with orjson.
+
+    Args:
+        body (dict or bytes): The response body, or an already serialized body.
+        status (int): The HTTP status code.
+
+    Returns:
+        Response: The JSON response.
+
+    """
+    if not isinstance(body, bytes):
+        body = orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+    return Response(body, status=status, mimetype="application/json")
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider that encodes and decodes with orjson.
+
+    Installed as ``app.json`` so that every ``jsonify()`` call and
+    ``request.get_json()`` use orjson. Non-string keys are allowed, as they
+    are with the standard library encoder.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype="application/json"
+        )
+
+
+def require_auth(view: Callable) -> Callable:
+    """Require either a valid API bearer token or a logged-in user.
+
+    Server-to-server callers (monitoring, CI) that send ``Authorization: Bearer
+    <API_TOKEN>`` are let through after a constant-time comparison, skipping the
+    session cookie check and user lookup done by ``login_required``. All other
+    requests fall through to ``login_required``. The fast path is disabled
+    unless ``API_TOKEN`` is configured.
+
+    Args:
+        view (Callable): The view function to protect.
+
+    Returns:
+        Callable: The wrapped view function.
+
+    """
+    session_view = login_required(view)
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        api_token = current_app.config.get("API_TOKEN")
+        auth_header = request.headers.get("Authorization", "")
+        if api_token and auth_header.startswith("Bearer "):
+            if hmac.compare_digest(auth_header[7:].encode(), api_token.encode()):
+                return view(*args, **kwargs)
+        return session_view(*args, **kwargs)
+
+    return wrapper
+
+
 def create_app(config_class=ProductionConfig):
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     configure_logger(app.logger)
 
     app.config.from_object(config_class)
 
-    db.init_app(app)  # Initialize db with app
-    with app.app_context():
-        db.create_all()  # Recreate all tables
+    # Size the connection pool explicitly. An in-memory SQLite database only exists
+    # for the lifetime of its connection, so it gets a single shared connection instead.
+    if app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite:///:memory:"):
+        engine_options = {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False}
+        }
+    else:
+        engine_options = {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 20)),
+            "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+            "pool_pre_ping": True
+        }
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options)
+
+    # Initialize database. Creating the schema is a one-shot job (see the init-db
+    # command) rather than something every worker repeats when it boots.
+    db.init_app(app)
+    if app.config.get("INIT_DB_ON_STARTUP"):
+        with app.app_context():
+            db.create_all()
+
+    @app.cli.command("init-db")
+    def init_db() -> None:
+        """Create any database tables that do not exist yet."""
+        db.create_all()
+        app.logger.info("Database tables created successfully")
 
     login_manager = LoginManager()
     login_manager.init_app(app)
     login_manager.login_view = "login"
 
+    # Detached Users rows keyed by username, so that repeat requests from a
+    # logged-in user do not need a database round-trip to resolve current_user.
+    # Flask-Login already memoizes current_user within a single request.
+    user_cache = TTLCache(
+        maxsize=int(os.getenv("USER_CACHE_SIZE", 10_000)),
+        ttl=int(os.getenv("USER_CACHE_TTL", 60))
+    )
+    user_cache_lock = threading.RLock()
+
+    def get_cached_user(username: str) -> Optional[Users]:
+        """Retrieve a user by username, using the user cache if possible.
+
+        Args:
+            username (str): The username of the user.
+
+        Returns:
+            Users: The (detached) user, or None if no such user exists.
+
+        """
+        with user_cache_lock:
+            user = user_cache.get(username)
+
+        if user is not None:
+            app.logger.debug("User cache hit: %s", username)
+            return user
+
+        app.logger.debug("User cache miss: %s", username)
+        user = Users.query.filter_by(username=username).first()
+        if user is not None:
+            db.session.expunge(user)
+            with user_cache_lock:
+                user_cache[username] = user
+        return user
+
+    def invalidate_cached_user(username: Optional[str] = None) -> None:
+        """Drop a single user, or every user if no username is given, from the user cache.
+
+        Args:
+            username (str, optional): The username to invalidate.
+
+        """
+        with user_cache_lock:
+            if username is None:
+                user_cache.clear()
+            else:
+                user_cache.pop(username, None)
+
     @login_manager.user_loader
     def load_user(user_id):
-        return Users.query.filter_by(username=user_id).first()
+        return get_cached_user(user_id)
 
     @login_manager.unauthorized_handler
     def unauthorized():
-        return make_response(jsonify({
+        return json_response(AUTH_REQUIRED, 401)
+
+
+    @app.errorhandler(ValueError)
+    def handle_value_error(e: ValueError) -> Response:
+        """Turn a ValueError raised by a route or model into a 400 response.
+
+        Args:
+            e (ValueError): The error that was raised.
+
+        Returns:
+            JSON response with the error message.
+
+        """
+        return json_response({
             "status": "error",
-            "message": "Authentication required"
-        }), 401)
+            "message": str(e)
+        }, 400)
+
+    @app.errorhandler(Exception)
+    def handle_exception(e: Exception) -> Union[Response, HTTPException]:
+        """Turn any other unhandled error into a 500 response.
+
+        HTTP errors raised by Flask itself (404, 405, ...) are passed through unchanged.
+
+        The exception and its traceback are logged; the client only gets a
+        generic message, so internal details never leak into the response.
+
+        Args:
+            e (Exception): The error that was raised.
+
+        Returns:
+            JSON response with a generic error message.
+
+        """
+        if isinstance(e, HTTPException):
+            return e
+        app.logger.exception("Request to %s failed: %s", request.path, e)
+        return json_response(INTERNAL_ERROR, 500)
 
 
     ring_model = RingModel()
 
+    # Serialized leaderboard responses keyed by sort field. Stats only change when
+    # boxers are added, deleted or fight, and those routes clear the cache; the TTL
+    # bounds staleness from changes made by other worker processes.
+    leaderboard_cache = TTLCache(maxsize=2, ttl=int(os.getenv("LEADERBOARD_CACHE_TTL", 30)))
+    leaderboard_cache_lock = threading.Lock()
+
+    def invalidate_leaderboard() -> None:
+        """Drop all cached leaderboard responses."""
+        with leaderboard_cache_lock:
+            leaderboard_cache.clear()
+
 
     ####################################################
     #
@@ -60,10 +283,7 @@ def create_app(config_class=ProductionConfig):
 
         """
         app.logger.info("Health check endpoint hit")
-        return make_response(jsonify({
-            'status': 'success',
-            'message': 'Service is running'
-        }), 200)
+        return json_response(SERVICE_RUNNING, 200)
 
 
     ##########################################################
@@ -88,34 +308,16 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue creating the user in the database.
         """
         try:
-            data = request.get_json()
-            username = data.get("username")
-            password = data.get("password")
-
-            if not username or not password:
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Username and password are required"
-                }), 400)
+            credentials = Credentials.model_validate_json(request.get_data())
+        except ValidationError:
+            return json_response(USERNAME_AND_PASSWORD_REQUIRED, 400)
+        username, password = credentials.username, credentials.password
 
-            Users.create_user(username, password)
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"User '{username}' created successfully"
-            }), 201)
-
-        except ValueError as e:
-            return make_response(jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 400)
-        except Exception as e:
-            app.logger.error(f"User creation failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while creating user",
-                "details": str(e)
-            }), 500)
+        Users.create_user(username, password)
+        return json_response({
+            "status": "success",
+            "message": f"User '{username}' created successfully"
+        }, 201)
 
     @app.route('/api/login', methods=['POST'])
     def login() -> Response:
@@ -132,41 +334,28 @@ def create_app(config_class=ProductionConfig):
             401 error if the username or password is incorrect.
         """
         try:
-            data = request.get_json()
-            username = data.get("username")
-            password = data.get("password")
-
-            if not username or not password:
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Username and password are required"
-                }), 400)
-
-            if Users.check_password(username, password):
-                user = Users.query.filter_by(username=username).first()
-                login_user(user)
-                return make_response(jsonify({
-                    "status": "success",
-                    "message": f"User '{username}' logged in successfully"
-                }), 200)
-            else:
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Invalid username or password"
-                }), 401)
+            credentials = Credentials.model_validate_json(request.get_data())
+        except ValidationError:
+            return json_response(USERNAME_AND_PASSWORD_REQUIRED, 400)
+        username, password = credentials.username, credentials.password
 
-        except ValueError as e:
-            return make_response(jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 401)
-        except Exception as e:
-            app.logger.error(f"Login failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred during login",
-                "details": str(e)
-            }), 500)
+        try:
+            password_ok = Users.check_password(username, password)
+        except ValueError:
+            # Unknown users get the same response as a wrong password
+            password_ok = False
+
+        if password_ok:
+            # Going through the user cache also warms it for load_user, so the
+            # user's next requests resolve current_user without a query
+            user = get_cached_user(username)
+            login_user(user)
+            return json_response({
+                "status": "success",
+                "message": f"User '{username}' logged in successfully"
+            }, 200)
+        else:
+            return json_response(INVALID_CREDENTIALS, 401)
 
     @app.route('/api/logout', methods=['POST'])
     @login_required
@@ -178,10 +367,7 @@ def create_app(config_class=ProductionConfig):
 
         """
         logout_user()
-        return make_response(jsonify({
-            "status": "success",
-            "message": "User logged out successfully"
-        }), 200)
+        return json_response(LOGGED_OUT, 200)
 
     @app.route('/api/change-password', methods=['POST'])
     @login_required
@@ -199,34 +385,17 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue updating the password in the database.
         """
         try:
-            data = request.get_json()
-            new_password = data.get("new_password")
-
-            if not new_password:
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "New password is required"
-                }), 400)
-
-            username = current_user.username
-            Users.update_password(username, new_password)
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Password changed successfully"
-            }), 200)
-
-        except ValueError as e:
-            return make_response(jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 400)
-        except Exception as e:
-            app.logger.error(f"Password change failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while changing password",
-                "details": str(e)
-            }), 500)
+            new_password = NewPassword.model_validate_json(request.get_data()).new_password
+        except ValidationError:
+            return json_response(NEW_PASSWORD_REQUIRED, 400)
+
+        username = current_user.username
+        Users.update_password(username, new_password)
+        invalidate_cached_user(username)
+        return json_response({
+            "status": "success",
+            "message": "Password changed successfully"
+        }, 200)
 
     @app.route('/api/reset-users', methods=['DELETE'])
     def reset_users() -> Response:
@@ -238,24 +407,14 @@ def create_app(config_class=ProductionConfig):
         Raises:
             500 error if there is an issue recreating the Users table.
         """
-        try:
-            app.logger.info("Received request to recreate Users table")
-            with app.app_context():
-                Users.__table__.drop(db.engine)
-                Users.__table__.create(db.engine)
-            app.logger.info("Users table recreated successfully")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Users table recreated successfully"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Users table recreation failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while deleting users",
-                "details": str(e)
-            }), 500)
+        app.logger.info("Received request to recreate Users table")
+        truncate_table(Users)
+        invalidate_cached_user()
+        app.logger.info("Users table recreated successfully")
+        return json_response({
+            "status": "success",
+            "message": f"Users table recreated successfully"
+        }, 200)
 
     ##########################################################
     #
@@ -273,24 +432,14 @@ def create_app(config_class=ProductionConfig):
         Raises:
             500 error if there is an issue recreating the Boxers table.
         """
-        try:
-            app.logger.info("Received request to recreate Boxers table")
-            with app.app_context():
-                Boxers.__table__.drop(db.engine)
-                Boxers.__table__.create(db.engine)
-            app.logger.info("Boxers table recreated successfully")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Boxers table recreated successfully"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Boxers table recreation failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while deleting users",
-                "details": str(e)
-            }), 500)
+        app.logger.info("Received request to recreate Boxers table")
+        truncate_table(Boxers)
+        invalidate_leaderboard()
+        app.logger.info("Boxers table recreated successfully")
+        return json_response({
+            "status": "success",
+            "message": f"Boxers table recreated successfully"
+        }, 200)
 
 
     @app.route('/api/add-boxer', methods=['POST'])
@@ -316,53 +465,38 @@ def create_app(config_class=ProductionConfig):
         app.logger.info("Received request to create new boxer")
 
         try:
-            data = request.get_json()
-
-            required_fields = ["name", "weight", "height", "reach", "age"]
-            missing_fields = [field for field in required_fields if field not in data]
+            boxer_in = BoxerIn.model_validate_json(request.get_data())
+        except ValidationError as e:
+            missing_fields = [err["loc"][0] for err in e.errors() if err["type"] == "missing"]
 
             if missing_fields:
-                app.logger.warning(f"Missing required fields: {missing_fields}")
-                return make_response(jsonify({
+                app.logger.warning("Missing required fields: %s", missing_fields)
+                return json_response({
                     "status": "error",
                     "message": f"Missing required fields: {', '.join(missing_fields)}"
-                }), 400)
-
-            name = data["name"]
-            weight = data["weight"]
-            height = data["height"]
-            reach = data["reach"]
-            age = data["age"]
-
-            if (
-                not isinstance(name, str)
-                or not isinstance(weight, (int, float))
-                or not isinstance(height, (int, float))
-                or not isinstance(reach, (int, float))
-                or not isinstance(age, int)
-            ):
-                app.logger.warning("Invalid input data types")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Invalid input types: name should be a string, weight/height/reach should be numbers, age should be an integer"
-                }), 400)
+                }, 400)
+
+            app.logger.warning("Invalid input data types")
+            return json_response({
+                "status": "error",
+                "message": "Invalid input types: name should be a string, weight/height/reach should be numbers, age should be an integer"
+            }, 400)
 
-            app.logger.info(f"Adding boxer: {name}, {weight}kg, {height}cm, {reach} inches, {age} years old")
-            Boxers.create_boxer(name, weight, height, reach, age)
+        name = boxer_in.name
+        weight = boxer_in.weight
+        height = boxer_in.height
+        reach = boxer_in.reach
+        age = boxer_in.age
 
-            app.logger.info(f"Boxer added successfully: {name}")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Boxer '{name}' added successfully"
-            }), 201)
+        app.logger.info("Adding boxer: %s, %skg, %scm, %s inches, %s years old", name, weight, height, reach, age)
+        Boxers.create_boxer(name, weight, height, reach, age)
+        invalidate_leaderboard()
 
-        except Exception as e:
-            app.logger.error(f"Failed to add boxer: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while adding the boxer",
-                "details": str(e)
-            }), 500)
+        app.logger.info("Boxer added successfully: %s", name)
+        return json_response({
+            "status": "success",
+            "message": f"Boxer '{name}' added successfully"
+        }, 201)
 
 
     @app.route('/api/delete-boxer/<int:boxer_id>', methods=['DELETE'])
@@ -381,37 +515,29 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue removing the boxer from the database.
 
         """
-        try:
-            app.logger.info(f"Received request to delete boxer with ID {boxer_id}")
-
-            # Check if the boxer exists before attempting to delete
-            boxer = Boxers.get_boxer_by_id(boxer_id)
-            if not boxer:
-                app.logger.warning(f"Boxer with ID {boxer_id} not found.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Boxer with ID {boxer_id} not found"
-                }), 400)
-
-            Boxers.delete_boxer(boxer_id)
-            app.logger.info(f"Successfully deleted boxer with ID {boxer_id}")
+        app.logger.info("Received request to delete boxer with ID %s", boxer_id)
+
+        # Delete and check for existence in a single statement
+        result = db.session.execute(delete(Boxers).where(Boxers.id == boxer_id))
+        db.session.commit()
+        if result.rowcount == 0:
+            app.logger.warning("Boxer with ID %s not found.", boxer_id)
+            return json_response({
+                "status": "error",
+                "message": f"Boxer with ID {boxer_id} not found"
+            }, 400)
 
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Boxer with ID {boxer_id} deleted successfully"
-            }), 200)
+        invalidate_leaderboard()
+        app.logger.info("Successfully deleted boxer with ID %s", boxer_id)
 
-        except Exception as e:
-            app.logger.error(f"Failed to add boxer: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while deleting the boxer",
-                "details": str(e)
-            }), 500)
+        return json_response({
+            "status": "success",
+            "message": f"Boxer with ID {boxer_id} deleted successfully"
+        }, 200)
 
 
     @app.route('/api/get-boxer-by-id/<int:boxer_id>', methods=['GET'])
-    @login_required
+    @require_auth
     def get_boxer_by_id(boxer_id: int) -> Response:
         """Route to get a boxer by its ID.
 
@@ -426,35 +552,26 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue retrieving the boxer from the database.
 
         """
-        try:
-            app.logger.info(f"Received request to retrieve boxer with ID {boxer_id}")
+        app.logger.info("Received request to retrieve boxer with ID %s", boxer_id)
 
-            boxer = Boxers.get_boxer_by_id(boxer_id)
-
-            if not boxer:
-                app.logger.warning(f"Boxer with ID {boxer_id} not found.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Boxer with ID {boxer_id} not found"
-                }), 400)
+        boxer = Boxers.get_boxer_by_id(boxer_id)
 
-            app.logger.info(f"Successfully retrieved boxer: {boxer}")
-            return make_response(jsonify({
-                "status": "success",
-                "boxer": boxer
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Error retrieving boxer with ID {boxer_id}: {e}")
-            return make_response(jsonify({
+        if not boxer:
+            app.logger.warning("Boxer with ID %s not found.", boxer_id)
+            return json_response({
                 "status": "error",
-                "message": "An internal error occurred while retrieving the boxer",
-                "details": str(e)
-            }), 500)
+                "message": f"Boxer with ID {boxer_id} not found"
+            }, 400)
+
+        app.logger.info("Successfully retrieved boxer: %s", boxer)
+        return json_response({
+            "status": "success",
+            "boxer": boxer
+        }, 200)
 
 
     @app.route('/api/get-boxer-by-name/<string:boxer_name>', methods=['GET'])
-    @login_required
+    @require_auth
     def get_boxer_by_name(boxer_name: str) -> Response:
         """Route to get a boxer by its name.
 
@@ -469,32 +586,22 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue retrieving the boxer from the database.
 
         """
-        try:
-            app.logger.info(f"Received request to retrieve boxer with name '{boxer_name}'")
-
-            boxer = Boxers.get_boxer_by_name(boxer_name)
+        app.logger.info("Received request to retrieve boxer with name '%s'", boxer_name)
 
-            if not boxer:
-                app.logger.warning(f"Boxer '{boxer_name}' not found.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Boxer '{boxer_name}' not found"
-                }), 400)
-
-            app.logger.info(f"Successfully retrieved boxer: {boxer}")
-            return make_response(jsonify({
-                "status": "success",
-                "boxer": boxer
-            }), 200)
+        boxer = Boxers.get_boxer_by_name(boxer_name)
 
-        except Exception as e:
-            app.logger.error(f"Error retrieving boxer with name '{boxer_name}': {e}")
-            return make_response(jsonify({
+        if not boxer:
+            app.logger.warning("Boxer '%s' not found.", boxer_name)
+            return json_response({
                 "status": "error",
-                "message": "An internal error occurred while retrieving the boxer",
-                "details": str(e)
-            }), 500)
+                "message": f"Boxer '{boxer_name}' not found"
+            }, 400)
 
+        app.logger.info("Successfully retrieved boxer: %s", boxer)
+        return json_response({
+            "status": "success",
+            "boxer": boxer
+        }, 200)
 
     ############################################################
     #
@@ -516,32 +623,17 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue during the fight.
 
         """
-        try:
-            app.logger.info("Initiating fight...")
-
-            winner = ring_model.fight()
+        app.logger.info("Initiating fight...")
 
-            app.logger.info(f"Fight complete. Winner: {winner}")
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Fight complete",
-                "winner": winner
-            }), 200)
+        winner = ring_model.fight()
+        invalidate_leaderboard()
 
-        except ValueError as e:
-            app.logger.warning(f"Fight cannot be triggered: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 400)
-
-        except Exception as e:
-            app.logger.error(f"Error while triggering fight: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while triggering the fight",
-                "details": str(e)
-            }), 500)
+        app.logger.info("Fight complete. Winner: %s", winner)
+        return json_response({
+            "status": "success",
+            "message": "Fight complete",
+            "winner": winner
+        }, 200)
 
 
     @app.route('/api/clear-boxers', methods=['POST'])
@@ -556,24 +648,15 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue clearing boxers.
 
         """
-        try:
-            app.logger.info("Clearing all boxers...")
+        app.logger.info("Clearing all boxers...")
 
-            ring_model.clear_ring()
+        ring_model.clear_ring()
 
-            app.logger.info("Boxers cleared from ring successfully.")
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Boxers have been cleared from ring."
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to clear boxers: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while clearing boxers",
-                "details": str(e)
-            }), 500)
+        app.logger.info("Boxers cleared from ring successfully.")
+        return json_response({
+            "status": "success",
+            "message": "Boxers have been cleared from ring."
+        }, 200)
 
 
     @app.route('/api/enter-ring', methods=['POST'])
@@ -592,58 +675,49 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue with the boxer entering the ring.
 
         """
-        try:
-            data = request.get_json()
-            boxer_name = data.get("name")
+        data = request.get_json()
+        boxer_name = data.get("name")
 
-            if not boxer_name:
-                app.logger.warning("Attempted to enter ring without specifying a boxer.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "You must name a boxer"
-                }), 400)
+        if not boxer_name:
+            app.logger.warning("Attempted to enter ring without specifying a boxer.")
+            return json_response({
+                "status": "error",
+                "message": "You must name a boxer"
+            }, 400)
 
-            app.logger.info(f"Attempting to enter {boxer_name} into the ring.")
+        app.logger.info("Attempting to enter %s into the ring.", boxer_name)
 
-            boxer = Boxers.get_boxer_by_name(boxer_name)
+        boxer = Boxers.get_boxer_by_name(boxer_name)
 
-            if not boxer:
-                app.logger.warning(f"Boxer '{boxer_name}' not found.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Boxer '{boxer_name}' not found"
-                }), 400)
-
-            try:
-                ring_model.enter_ring(boxer)
-            except ValueError as e:
-                app.logger.warning(f"Cannot enter {boxer_name}: {e}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": str(e)
-                }), 400)
+        if not boxer:
+            app.logger.warning("Boxer '%s' not found.", boxer_name)
+            return json_response({
+                "status": "error",
+                "message": f"Boxer '{boxer_name}' not found"
+            }, 400)
 
-            boxers = ring_model.get_boxers()
+        try:
+            ring_model.enter_ring(boxer)
+        except ValueError as e:
+            app.logger.warning("Cannot enter %s: %s", boxer_name, e)
+            return json_response({
+                "status": "error",
+                "message": str(e)
+            }, 400)
 
-            app.logger.info(f"Boxer '{boxer_name}' entered the ring. Current boxers: {boxers}")
+        boxers = ring_model.get_boxers()
 
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Boxer '{boxer_name}' is now in the ring.",
-                "boxers": boxers
-            }), 200)
+        app.logger.info("Boxer '%s' entered the ring. Current boxers: %s", boxer_name, boxers)
 
-        except Exception as e:
-            app.logger.error(f"Failed to enter boxer into the ring: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while entering the boxer into the ring",
-                "details": str(e)
-            }), 500)
+        return json_response({
+            "status": "success",
+            "message": f"Boxer '{boxer_name}' is now in the ring.",
+            "boxers": boxers
+        }, 200)
 
 
     @app.route('/api/get-boxers', methods=['GET'])
-    @login_required
+    @require_auth
     def get_boxers() -> Response:
         """Route to get the list of boxers in the ring.
 
@@ -654,25 +728,15 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue getting the boxers.
 
         """
-        try:
-            app.logger.info("Retrieving list of boxers...")
-
-            boxers = ring_model.get_boxers()
+        app.logger.info("Retrieving list of boxers...")
 
-            app.logger.info(f"Retrieved {len(boxers)} boxer(s).")
-            return make_response(jsonify({
-                "status": "success",
-                "boxers": boxers
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to retrieve boxers: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while retrieving boxers",
-                "details": str(e)
-            }), 500)
+        boxers = ring_model.get_boxers()
 
+        app.logger.info("Retrieved %s boxer(s).", len(boxers))
+        return json_response({
+            "status": "success",
+            "boxers": boxers
+        }, 200)
 
     ############################################################
     #
@@ -696,47 +760,53 @@ def create_app(config_class=ProductionConfig):
             500 error if there is an issue generating the leaderboard.
 
         """
-        try:
-            # Get the sort parameter from the query string, default to 'wins'
-            sort_by = request.args.get('sort', 'wins').lower()
+        # Get the sort parameter from the query string, default to 'wins'
+        sort_by = request.args.get('sort', 'wins').lower()
 
-            valid_sort_fields = {'wins', 'win_pct'}
+        if sort_by not in VALID_SORT_FIELDS:
+            app.logger.warning("Invalid sort parameter: '%s'", sort_by)
+            return json_response({
+                "status": "error",
+                "message": f"Invalid sort parameter '{sort_by}'. Must be one of: {', '.join(sorted(VALID_SORT_FIELDS))}"
+            }, 400)
 
-            if sort_by not in valid_sort_fields:
-                app.logger.warning(f"Invalid sort parameter: '{sort_by}'")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Invalid sort parameter '{sort_by}'. Must be one of: {', '.join(valid_sort_fields)}"
-                }), 400)
+        with leaderboard_cache_lock:
+            body = leaderboard_cache.get(sort_by)
 
-            app.logger.info(f"Generating leaderboard sorted by '{sort_by}'")
+        if body is None:
+            app.logger.info("Generating leaderboard sorted by '%s'", sort_by)
 
             leaderboard_data = Boxers.get_leaderboard(sort_by)
 
-            app.logger.info(f"Leaderboard generated successfully. {len(leaderboard_data)} boxers ranked.")
+            app.logger.info("Leaderboard generated successfully. %s boxers ranked.", len(leaderboard_data))
 
-            return make_response(jsonify({
+            body = orjson.dumps({
                 "status": "success",
                 "leaderboard": leaderboard_data
-            }), 200)
+            }, option=orjson.OPT_NON_STR_KEYS)
+            with leaderboard_cache_lock:
+                leaderboard_cache[sort_by] = body
+        else:
+            app.logger.debug("Serving cached leaderboard sorted by '%s'", sort_by)
 
-        except Exception as e:
-            app.logger.error(f"Error generating leaderboard: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while generating the leaderboard",
-                "details": str(e)
-            }), 500)
+        # Only the body is cached; each request gets its own Response object
+        return json_response(body, 200)
 
     return app
 
 
 if __name__ == '__main__':
+    from gevent.pywsgi import WSGIServer
+
     app = create_app()
+    with app.app_context():
+        db.create_all()
     app.logger.info("Starting Flask app...")
     try:
-        app.run(debug=True, host='0.0.0.0', port=5000)
+        # Production is normally served by Gunicorn via wsgi.py; running this
+        # module directly serves the same app on gevent's WSGIServer
+        WSGIServer(('0.0.0.0', 5000), app, log=app.logger).serve_forever()
     except Exception as e:
-        app.logger.error(f"Flask app encountered an error: {e}")
+        app.logger.error("Flask app encountered an error: %s", e)
     finally:
         app.logger.info("Flask app has stopped.")
\ No newline at end of file
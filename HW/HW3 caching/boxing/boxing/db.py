@@ -1,3 +1,60 @@
+import sqlite3
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+# Objects keep their loaded state after a commit instead of being expired, so
+# touching them afterwards (or once detached, e.g. from a cache) does not re-SELECT
+db = SQLAlchemy(session_options={"expire_on_commit": False})
+
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune every new SQLite connection for concurrent, commit-heavy use.
+
+    WAL lets readers proceed while a write is in progress, and with it
+    synchronous=NORMAL only syncs at checkpoints instead of on every commit,
+    which stays safe against corruption. Other databases are left untouched.
+
+    Args:
+        dbapi_connection: The new DB-API connection.
+        connection_record: The pool's record for the connection (unused).
+
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.close()
+
+
+def truncate_table(model: type[db.Model]) -> None:
+    """Delete every row of a model's table in a single statement.
+
+    Unlike dropping and recreating the table, this issues no DDL and leaves the
+    schema untouched. Auto-generated IDs start over from 1 afterwards.
+
+    Args:
+        model (type[db.Model]): The model whose table should be emptied.
 
-db = SQLAlchemy()
+    """
+    table = db.engine.dialect.identifier_preparer.quote(model.__tablename__)
+    if db.engine.dialect.name == "sqlite":
+        # SQLite has no TRUNCATE, but an unqualified DELETE is optimized into one.
+        # Rowids restart at 1 once the table is empty, unless the table uses
+        # AUTOINCREMENT, whose counter lives in sqlite_sequence.
+        db.session.execute(text(f"DELETE FROM {table}"))
+        if db.session.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence'"
+        )).first():
+            db.session.execute(
+                text("DELETE FROM sqlite_sequence WHERE name = :name"),
+                {"name": model.__tablename__}
+            )
+    else:
+        db.session.execute(text(f"TRUNCATE TABLE {table} RESTART IDENTITY CASCADE"))
+    db.session.commit()
@@ -1,6 +1,7 @@
 import logging
 from typing import List
 
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from boxing.db import db
@@ -77,15 +78,15 @@ class Boxers(db.Model):
             SQLAlchemyError: If there is a database error during creation.
 
         """
-        logger.info(f"Creating boxer: {name}, {weight=} {height=} {reach=} {age=}")
+        logger.info("Creating boxer: %s, weight=%r height=%r reach=%r age=%r", name, weight, height, reach, age)
 
         try:
-            logger.info(f"Boxer created successfully: {name}")
+            logger.info("Boxer created successfully: %s", name)
         except IntegrityError:
-            logger.error(f"Boxer with name '{name}' already exists.")
+            logger.error("Boxer with name '%s' already exists.", name)
         except SQLAlchemyError as e:
             db.session.rollback()
-            logger.error(f"Database error during creation: {e}")
+            logger.error("Database error during creation: %s", e)
 
     @classmethod
     def get_boxer_by_id(cls, boxer_id: int) -> "Boxers":
@@ -102,7 +103,7 @@ class Boxers(db.Model):
 
         """
         if boxer is None:
-            logger.info(f"Boxer with ID {boxer_id} not found.")
+            logger.info("Boxer with ID %s not found.", boxer_id)
         pass
 
     @classmethod
@@ -120,7 +121,7 @@ class Boxers(db.Model):
 
         """
         if boxer is None:
-            logger.info(f"Boxer '{name}' not found.")
+            logger.info("Boxer '%s' not found.", name)
         pass
 
     @classmethod
@@ -136,11 +137,11 @@ class Boxers(db.Model):
         """
         boxer = cls.get_boxer_by_id(boxer_id)
         if boxer is None:
-            logger.info(f"Boxer with ID {boxer_id} not found.")
+            logger.info("Boxer with ID %s not found.", boxer_id)
             raise ValueError(f"Boxer with ID {boxer_id} not found.")
         db.session.delete(boxer)
         db.session.commit()
-        logger.info(f"Boxer with ID {boxer_id} permanently deleted.")
+        logger.info("Boxer with ID %s permanently deleted.", boxer_id)
 
     def update_stats(self, result: str) -> None:
         """Update the boxer's fight and win count based on result.
@@ -164,7 +165,7 @@ class Boxers(db.Model):
             raise ValueError("Wins cannot exceed number of fights.")
 
         db.session.commit()
-        logger.info(f"Updated stats for boxer {self.name}: {self.fights} fights, {self.wins} wins.")
+        logger.info("Updated stats for boxer %s: %s fights, %s wins.", self.name, self.fights, self.wins)
 
     @staticmethod
     def get_leaderboard(sort_by: str = "wins") -> List[dict]:
@@ -180,30 +181,43 @@ class Boxers(db.Model):
             ValueError: If the sort_by parameter is not valid.
 
         """
-        logger.info(f"Retrieving leaderboard. Sort by: {sort_by}")
+        logger.info("Retrieving leaderboard. Sort by: %s", sort_by)
 
         if sort_by not in {"wins", "win_pct"}:
-            logger.error(f"Invalid sort_by parameter: {sort_by}")
+            logger.error("Invalid sort_by parameter: %s", sort_by)
             raise ValueError(f"Invalid sort_by parameter: {sort_by}")
 
-        boxers = Boxers.query.filter(Boxers.fights > 0).all()
-
-        def compute_win_pct(b: Boxers) -> float:
-            return round((b.wins / b.fights) * 100, 1) if b.fights > 0 else 0.0
-
-        leaderboard = [{
-            "id": b.id,
-            "name": b.name,
-            "weight": b.weight,
-            "height": b.height,
-            "reach": b.reach,
-            "age": b.age,
-            "weight_class": b.weight_class,
-            "fights": b.fights,
-            "wins": b.wins,
-            "win_pct": compute_win_pct(b)
-        } for b in boxers]
-
-        leaderboard.sort(key=lambda b: b[sort_by], reverse=True)
+        # Select plain columns rather than hydrating a Boxers object per row. SQL only
+        # divides: win_pct is rounded in Python, since SQL ROUND rounds halves up
+        # where round() does not (1 win in 16 fights is 6.2, not 6.3)
+        win_ratio = (Boxers.wins * 1.0 / Boxers.fights).label("win_pct")
+        stmt = (
+            select(
+                Boxers.id,
+                Boxers.name,
+                Boxers.weight,
+                Boxers.height,
+                Boxers.reach,
+                Boxers.age,
+                Boxers.weight_class,
+                Boxers.fights,
+                Boxers.wins,
+                win_ratio
+            )
+            .where(Boxers.fights > 0)
+        )
+        # Ties keep id order. Wins are exact, so the database can sort them; win_pct
+        # is sorted after rounding, so boxers that round to the same value tie
+        if sort_by == "wins":
+            stmt = stmt.order_by(Boxers.wins.desc(), Boxers.id)
+        else:
+            stmt = stmt.order_by(Boxers.id)
+
+        leaderboard = [dict(row) for row in db.session.execute(stmt).mappings()]
+        for entry in leaderboard:
+            entry["win_pct"] = round(entry["win_pct"] * 100, 1)
+        if sort_by == "win_pct":
+            leaderboard.sort(key=lambda b: b["win_pct"], reverse=True)
+
         logger.info("Leaderboard retrieved successfully.")
         return leaderboard
@@ -52,25 +52,25 @@ class RingModel:
 
         boxer_1, boxer_2 = self.get_boxers()
 
-        logger.info(f"Fight started between {boxer_1.name} and {boxer_2.name}")
+        logger.info("Fight started between %s and %s", boxer_1.name, boxer_2.name)
 
         skill_1 = self.get_fighting_skill(boxer_1)
         skill_2 = self.get_fighting_skill(boxer_2)
 
-        logger.debug(f"Fighting skill for {boxer_1.name}: {skill_1:.3f}")
-        logger.debug(f"Fighting skill for {boxer_2.name}: {skill_2:.3f}")
+        logger.debug("Fighting skill for %s: %.3f", boxer_1.name, skill_1)
+        logger.debug("Fighting skill for %s: %.3f", boxer_2.name, skill_2)
 
         # Compute the absolute skill difference
         # And normalize using a logistic function for better probability scaling
         delta = abs(skill_1 - skill_2)
         normalized_delta = 1 / (1 + math.e ** (-delta))
 
-        logger.debug(f"Raw delta between skills: {delta:.3f}")
-        logger.debug(f"Normalized delta: {normalized_delta:.3f}")
+        logger.debug("Raw delta between skills: %.3f", delta)
+        logger.debug("Normalized delta: %.3f", normalized_delta)
 
         random_number = get_random()
 
-        logger.debug(f"Random number from random.org: {random_number:.3f}")
+        logger.debug("Random number from random.org: %.3f", random_number)
 
         if random_number < normalized_delta:
             winner = boxer_1
@@ -79,7 +79,7 @@ class RingModel:
             winner = boxer_2
             loser = boxer_1
 
-        logger.info(f"The winner is: {winner.name}")
+        logger.info("The winner is: %s", winner.name)
 
         winner.update_stats('win')
         loser.update_stats('loss')
@@ -111,7 +111,7 @@ class RingModel:
 
         """
         if len(self.ring) >= 2:
-            logger.error(f"Attempted to add boxer ID {boxer_id} but the ring is full")
+            logger.error("Attempted to add boxer ID %s but the ring is full", boxer_id)
 
         try:
             boxer = Boxers.get_boxer_by_id(boxer_id)
@@ -119,9 +119,10 @@ class RingModel:
             logger.error(str(e))
             raise
 
-        logger.info(f"Adding boxer '{boxer.name}' (ID {boxer_id}) to the ring")
+        logger.info("Adding boxer '%s' (ID %s) to the ring", boxer.name, boxer_id)
 
-        logger.info(f"Current boxers in the ring: {[Boxers.get_boxer_by_id(b).name for b in self.ring]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Current boxers in the ring: %s", [Boxers.get_boxer_by_id(b).name for b in self.ring])
 
 
     def get_boxers(self) -> List[Boxers]:
@@ -134,15 +135,15 @@ class RingModel:
         if not self.ring:
             logger.warning("Retrieving boxers from an empty ring.")
         else:
-            logger.info(f"Retrieving {len(self.ring)} boxers from the ring.")
+            logger.info("Retrieving %d boxers from the ring.", len(self.ring))
 
         for boxer_id in self.ring:
             if expired:
-                logger.info(f"TTL expired or missing for boxer {boxer_id}. Refreshing from DB.")
+                logger.info("TTL expired or missing for boxer %s. Refreshing from DB.", boxer_id)
             else:
-                logger.debug(f"Using cached boxer {boxer_id} (TTL valid).")
+                logger.debug("Using cached boxer %s (TTL valid).", boxer_id)
 
-        logger.info(f"Retrieved {len(boxers)} boxers from the ring.")
+        logger.info("Retrieved %d boxers from the ring.", len(boxers))
 
     def get_fighting_skill(self, boxer: Boxers) -> float:
         """Calculates the fighting skill for a boxer based on arbitrary rules.
@@ -159,13 +160,13 @@ class RingModel:
             float: The calculated fighting skill.
 
         """
-        logger.info(f"Calculating fighting skill for {boxer.name}: weight={boxer.weight}, age={boxer.age}, reach={boxer.reach}")
+        logger.info("Calculating fighting skill for %s: weight=%s, age=%s, reach=%s", boxer.name, boxer.weight, boxer.age, boxer.reach)
 
         # Arbitrary calculations
         age_modifier = -1 if boxer.age < 25 else (-2 if boxer.age > 35 else 0)
         skill = (boxer.weight * len(boxer.name)) + (boxer.reach / 10) + age_modifier
 
-        logger.info(f"Fighting skill for {boxer.name}: {skill:.3f}")
+        logger.info("Fighting skill for %s: %.3f", boxer.name, skill)
         return skill
 
     def clear_cache(self):
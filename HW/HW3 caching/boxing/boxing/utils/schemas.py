@@ -0,0 +1,50 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BoxerIn(BaseModel):
+    """Request body for the add-boxer route.
+
+    Strict mode mirrors the route's original isinstance checks: weight, height
+    and reach accept ints or floats, while age must be an int.
+
+    Attributes:
+        name (str): The boxer's name.
+        weight (float): The boxer's weight.
+        height (float): The boxer's height.
+        reach (float): The boxer's reach in inches.
+        age (int): The boxer's age.
+
+    """
+    model_config = ConfigDict(strict=True)
+
+    name: str
+    weight: float
+    height: float
+    reach: float
+    age: int
+
+
+class Credentials(BaseModel):
+    """Request body for the create-user and login routes.
+
+    Attributes:
+        username (str): The username of the user.
+        password (str): The password of the user.
+
+    """
+    model_config = ConfigDict(strict=True)
+
+    username: str = Field(min_length=1)
+    password: str = Field(min_length=1)
+
+
+class NewPassword(BaseModel):
+    """Request body for the change-password route.
+
+    Attributes:
+        new_password (str): The new password to set.
+
+    """
+    model_config = ConfigDict(strict=True)
+
+    new_password: str = Field(min_length=1)
@@ -10,11 +10,14 @@ class ProductionConfig():
     SESSION_COOKIE_PATH = '/'
     SESSION_COOKIE_DOMAIN = None
     SECRET_KEY = os.getenv("SECRET_KEY", "test-secret-key")  # Default secret key for testing
+    API_TOKEN = os.getenv("API_TOKEN")  # Bearer token for read-only service calls; unset disables it
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', "sqlite:////app/db/app.db")  # Production database URI from environment
+    INIT_DB_ON_STARTUP = False  # Create tables with `flask --app app init-db` instead
 
 class TestConfig():
     """Testing configuration."""
     TESTING = True
+    SECRET_KEY = "test-secret-key"  # Needed for logins in route tests
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'  # Use in-memory database for tests
@@ -0,0 +1,16 @@
+import os
+
+# Gunicorn picks this file up automatically when started from the app directory:
+#   gunicorn wsgi:app
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# The app keeps state in process memory (the ring, the leaderboard cache and the user cache),
+# so more than one worker would give each process its own diverging copy.
+# Concurrency comes from gevent: one worker multiplexes many connections.
+workers = int(os.getenv("GUNICORN_WORKERS", 1))
+worker_class = "gevent"
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+accesslog = "-"
+errorlog = "-"
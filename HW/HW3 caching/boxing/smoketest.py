@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
 
@@ -22,16 +24,23 @@ def run_smoketest():
         "age": 30
     }
 
-    health_response = requests.get(f"{base_url}/health")
+    # The health check and both resets are independent, so issue them
+    # concurrently; everything after this depends on their outcome.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        health_future = pool.submit(requests.get, f"{base_url}/health")
+        delete_user_future = pool.submit(requests.delete, f"{base_url}/reset-users")
+        delete_boxer_future = pool.submit(requests.delete, f"{base_url}/reset-boxers")
+
+    health_response = health_future.result()
     assert health_response.status_code == 200
     assert health_response.json()["status"] == "success"
 
-    delete_user_response = requests.delete(f"{base_url}/reset-users")
+    delete_user_response = delete_user_future.result()
     assert delete_user_response.status_code == 200
     assert delete_user_response.json()["status"] == "success"
     print("Reset users successful")
 
-    delete_boxer_response = requests.delete(f"{base_url}/reset-boxers")
+    delete_boxer_response = delete_boxer_future.result()
     assert delete_boxer_response.status_code == 200
     assert delete_boxer_response.json()["status"] == "success"
     print("Reset boxers successful")
@@ -6,6 +6,8 @@ from boxing.db import db
 
 @pytest.fixture
 def app():
+    # Built per test: the ring and the leaderboard cache live in create_app's
+    # closure, so a shared app would carry their state from one test to the next
     app = create_app(TestConfig)
     with app.app_context():
         db.create_all()
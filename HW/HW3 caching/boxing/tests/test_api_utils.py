@@ -1,7 +1,9 @@
+from types import SimpleNamespace
+
 import pytest
 import requests
 
-from boxing.utils.api_utils import get_random
+from boxing.utils.api_utils import SESSION, get_random
 
 
 RANDOM_NUMBER = 0.42
@@ -9,12 +11,14 @@ RANDOM_NUMBER = 0.42
 
 @pytest.fixture
 def mock_random_org(mocker):
-    # Patch the requests.get call
-    # requests.get returns an object, which we have replaced with a mock object
-    mock_response = mocker.Mock()
-    # We are giving that object a text attribute
-    mock_response.text = f"{RANDOM_NUMBER}"
-    mocker.patch("requests.get", return_value=mock_response)
+    # Patch the SESSION.get call
+    # SESSION.get returns an object, which we have replaced with a plain stub
+    # carrying only what get_random uses: a content attribute and raise_for_status
+    mock_response = SimpleNamespace(
+        content=f"{RANDOM_NUMBER}".encode(),
+        raise_for_status=lambda: None
+    )
+    mocker.patch("boxing.utils.api_utils.SESSION.get", return_value=mock_response)
     return mock_response
 
 def test_get_random(mock_random_org):
@@ -27,14 +31,14 @@ def test_get_random(mock_random_org):
     assert result == RANDOM_NUMBER, f"Expected random number {RANDOM_NUMBER}, but got {result}"
 
     # Ensure that the correct URL was called
-    requests.get.assert_called_once_with("https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new", timeout=5)
+    SESSION.get.assert_called_once_with("https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new", timeout=5)
 
 def test_get_random_request_failure(mocker):
     """Test handling of a request failure when calling random.org.
 
     """
     # Simulate a request failure
-    mocker.patch("requests.get", side_effect=requests.exceptions.RequestException("Connection error"))
+    mocker.patch("boxing.utils.api_utils.SESSION.get", side_effect=requests.exceptions.RequestException("Connection error"))
 
     with pytest.raises(RuntimeError, match="Request to random.org failed: Connection error"):
         get_random()
@@ -44,7 +48,7 @@ def test_get_random_timeout(mocker):
 
     """
     # Simulate a timeout
-    mocker.patch("requests.get", side_effect=requests.exceptions.Timeout)
+    mocker.patch("boxing.utils.api_utils.SESSION.get", side_effect=requests.exceptions.Timeout)
 
     with pytest.raises(RuntimeError, match="Request to random.org timed out."):
         get_random()
@@ -54,7 +58,7 @@ def test_get_random_invalid_response(mock_random_org):
 
     """
     # Simulate an invalid response (non-digit)
-    mock_random_org.text = "invalid_response"
+    mock_random_org.content = b"invalid_response"
 
     with pytest.raises(ValueError, match="Invalid response from random.org: invalid_response"):
         get_random()
@@ -0,0 +1,108 @@
+from flask_login import UserMixin
+import pytest
+
+
+API_TOKEN = "test-api-token"
+BOXER = {"id": 1, "name": "Muhammad Ali"}
+CREDENTIALS = {"username": "testuser", "password": "password123"}
+
+
+class StubUser(UserMixin):
+    """Stand-in for a Users row; flask_login only needs its id."""
+    id = CREDENTIALS["username"]
+
+
+# --- Fixtures ---
+
+@pytest.fixture
+def token_app(app):
+    """Fixture for an app with the API bearer token configured."""
+    app.config["API_TOKEN"] = API_TOKEN
+    return app
+
+
+@pytest.fixture
+def mock_get_boxer(mocker):
+    """Fixture that stubs the boxer lookup behind a require_auth route."""
+    return mocker.patch("app.Boxers.get_boxer_by_id", return_value=BOXER)
+
+
+@pytest.fixture
+def mock_login(mocker):
+    """Fixture that stubs the password check and user lookup behind the login route."""
+    check_password = mocker.patch("app.Users.check_password", return_value=True)
+    query = mocker.patch("app.Users.query", create=True)
+    query.filter_by.return_value.first.return_value = StubUser()
+    # The stand-in user is not a mapped instance, so it cannot be detached for the cache
+    mocker.patch("app.db.session.expunge")
+    return check_password
+
+
+# --- require_auth ---
+
+def test_require_auth_without_credentials(token_app, mock_get_boxer):
+    """Test that a request with neither a token nor a session is rejected."""
+    response = token_app.test_client().get("/api/get-boxer-by-id/1")
+
+    assert response.status_code == 401
+    assert response.get_json() == {"status": "error", "message": "Authentication required"}
+    mock_get_boxer.assert_not_called()
+
+
+def test_require_auth_with_wrong_token(token_app, mock_get_boxer):
+    """Test that a wrong bearer token falls through to the session check and is rejected."""
+    response = token_app.test_client().get(
+        "/api/get-boxer-by-id/1",
+        headers={"Authorization": "Bearer not-the-token"}
+    )
+
+    assert response.status_code == 401
+    mock_get_boxer.assert_not_called()
+
+
+def test_require_auth_with_correct_token(token_app, mock_get_boxer):
+    """Test that the configured bearer token is accepted without a session."""
+    response = token_app.test_client().get(
+        "/api/get-boxer-by-id/1",
+        headers={"Authorization": f"Bearer {API_TOKEN}"}
+    )
+
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "success", "boxer": BOXER}
+    mock_get_boxer.assert_called_once_with(1)
+
+
+def test_require_auth_token_needs_bearer_scheme(token_app, mock_get_boxer):
+    """Test that the token is only accepted with the Bearer scheme."""
+    response = token_app.test_client().get(
+        "/api/get-boxer-by-id/1",
+        headers={"Authorization": API_TOKEN}
+    )
+
+    assert response.status_code == 401
+    mock_get_boxer.assert_not_called()
+
+
+def test_require_auth_token_disabled_when_unset(app, mock_get_boxer):
+    """Test that no bearer token is accepted when API_TOKEN is not configured."""
+    app.config["API_TOKEN"] = None
+
+    response = app.test_client().get(
+        "/api/get-boxer-by-id/1",
+        headers={"Authorization": "Bearer "}
+    )
+
+    assert response.status_code == 401
+    mock_get_boxer.assert_not_called()
+
+
+def test_require_auth_falls_back_to_session(token_app, mock_get_boxer, mock_login):
+    """Test that a logged-in user is let through without a token."""
+    client = token_app.test_client()
+    assert client.post("/api/login", json=CREDENTIALS).status_code == 200
+    mock_login.assert_called_once_with(CREDENTIALS["username"], CREDENTIALS["password"])
+
+    response = client.get("/api/get-boxer-by-id/1")
+
+    assert response.status_code == 200
+    mock_get_boxer.assert_called_once_with(1)
@@ -1,19 +1,139 @@
+import os
+import threading
+from typing import Optional, Union
+
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from flask import Flask, jsonify, make_response, Response, request
+from flask import Blueprint, Flask, Response, current_app, request
+from flask.json.provider import JSONProvider
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from flask_session import Session
+import orjson
+import redis
+from pydantic import ValidationError
+from sqlalchemy.orm import load_only
+from sqlalchemy.pool import StaticPool
+from werkzeug.exceptions import HTTPException
+from werkzeug.local import LocalProxy
 
 from config import ProductionConfig
 
-from playlist.db import db
+from playlist.db import db, truncate_table
 from playlist.models.song_model import Songs
 from playlist.models.playlist_model import PlaylistModel
 from playlist.models.user_model import Users
 from playlist.utils.logger import configure_logger
+from playlist.utils.schemas import Credentials, NewPassword, SongIn
 
 
 load_dotenv()
 
 
+# Bodies of constant responses, serialized once at import time. A fresh Response
+# is still built per request so headers and cookies never leak between responses.
+AUTH_REQUIRED = orjson.dumps({"status": "error", "message": "Authentication required"})
+USERNAME_AND_PASSWORD_REQUIRED = orjson.dumps({"status": "error", "message": "Username and password are required"})
+INVALID_CREDENTIALS = orjson.dumps({"status": "error", "message": "Invalid username or password"})
+NEW_PASSWORD_REQUIRED = orjson.dumps({"status": "error", "message": "New password is required"})
+SERVICE_RUNNING = orjson.dumps({"status": "success", "message": "Service is running"})
+LOGGED_OUT = orjson.dumps({"status": "success", "message": "User logged out successfully"})
+INTERNAL_ERROR = orjson.dumps({"status": "error", "message": "An internal error occurred"})
+
+
+def json_response(body: Union[dict, bytes], status: int = 200) -> Response:
+    """Build a JSON response, serializing the body with orjson.
+
+    Args:
+        body (dict or bytes): The response body, or an already serialized body.
+        status (int): The HTTP status code.
+
+    Returns:
+        Response: The JSON response.
+
+    """
+    if not isinstance(body, bytes):
+        body = orjson.dumps(body)
+    return Response(body, status=status, mimetype="application/json")
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider that encodes and decodes with orjson.
+
+    Installed as ``app.json`` so that ``request.get_json()`` and any remaining
+    ``jsonify()`` calls use orjson as well.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
+bp = Blueprint("api", __name__, url_prefix="/api")
+
+# Each app gets its own playlist, created in create_app.
+playlist_model = LocalProxy(lambda: current_app.extensions["playlist_model"])
+
+
+def get_cached_user(username: str) -> Optional[Users]:
+    """Retrieve a user by username, using the app's user cache if possible.
+
+    The cache holds detached Users rows keyed by username, so that repeat requests
+    from a logged-in user do not need a database round-trip to resolve current_user.
+    The same instance is shared by concurrent requests and only has id and username
+    loaded, so it must be treated as read-only: never attach it to a session or
+    modify it. Writes go through a fresh query or an UPDATE by ID, followed by
+    invalidate_cached_user.
+
+    Args:
+        username (str): The username of the user.
+
+    Returns:
+        Users: The (detached) user, or None if no such user exists.
+
+    """
+    user_cache = current_app.extensions["user_cache"]
+    with current_app.extensions["user_cache_lock"]:
+        user = user_cache.get(username)
+
+    if user is not None:
+        current_app.logger.debug("User cache hit: %s", username)
+        return user
+
+    current_app.logger.debug("User cache miss: %s", username)
+    # Resolving current_user only needs the identity columns; leaving the password
+    # hash unloaded also keeps it out of the cache, and raiseload makes any attempt
+    # to read it from the cached instance fail loudly
+    user = Users.query.options(
+        load_only(Users.id, Users.username, raiseload=True)
+    ).filter_by(username=username).first()
+    if user is not None:
+        db.session.expunge(user)
+        with current_app.extensions["user_cache_lock"]:
+            user_cache[username] = user
+    return user
+
+
+def invalidate_cached_user(username: Optional[str] = None) -> None:
+    """Drop a single user, or every user if no username is given, from the user cache.
+
+    Args:
+        username (str, optional): The username to invalidate.
+
+    """
+    user_cache = current_app.extensions["user_cache"]
+    with current_app.extensions["user_cache_lock"]:
+        if username is None:
+            user_cache.clear()
+        else:
+            user_cache.pop(username, None)
+
+
 def create_app(config_class=ProductionConfig) -> Flask:
     """Create a Flask application with the specified configuration.
 
@@ -25,1487 +145,1257 @@ def create_app(config_class=ProductionConfig) -> Flask:
 
     """
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     configure_logger(app.logger)
 
     app.config.from_object(config_class)
 
-    # Initialize database
+    # Size the connection pool explicitly. An in-memory SQLite database only exists
+    # for the lifetime of its connection, so it gets a single shared connection instead.
+    if app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite:///:memory:"):
+        engine_options = {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False}
+        }
+    else:
+        engine_options = {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 20)),
+            "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+            "pool_pre_ping": True
+        }
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options)
+
+    # Initialize database. Creating the schema is a one-shot job (see the init-db
+    # command) rather than something every worker repeats when it boots.
     db.init_app(app)
-    with app.app_context():
+    if app.config.get("INIT_DB_ON_STARTUP"):
+        with app.app_context():
+            db.create_all()
+
+    @app.cli.command("init-db")
+    def init_db() -> None:
+        """Create any database tables that do not exist yet."""
         db.create_all()
+        app.logger.info("Database tables created successfully")
+
+    # With a Redis URL configured, the session cookie only carries an ID and the
+    # session itself is a single Redis lookup instead of a signed cookie payload.
+    if app.config.get("SESSION_REDIS_URL"):
+        app.config.update(
+            SESSION_TYPE="redis",
+            SESSION_REDIS=redis.from_url(app.config["SESSION_REDIS_URL"]),
+            SESSION_PERMANENT=False
+        )
+        Session(app)
 
     # Initialize login manager
     login_manager = LoginManager()
     login_manager.init_app(app)
-    login_manager.login_view = 'login'
+    login_manager.login_view = 'api.login'
 
     @login_manager.user_loader
     def load_user(user_id):
-        return Users.query.filter_by(username=user_id).first()
+        return get_cached_user(user_id)
 
     @login_manager.unauthorized_handler
     def unauthorized():
-        return make_response(jsonify({
-            "status": "error",
-            "message": "Authentication required"
-        }), 401)
+        return json_response(AUTH_REQUIRED, 401)
 
-    playlist_model = PlaylistModel()
+    @app.errorhandler(ValueError)
+    def handle_value_error(e: ValueError) -> Response:
+        """Turn a ValueError raised by a route or model into a 400 response.
 
-    @app.route('/api/health', methods=['GET'])
-    def healthcheck() -> Response:
-        """Health check route to verify the service is running.
+        Args:
+            e (ValueError): The error that was raised.
 
         Returns:
-            JSON response indicating the health status of the service.
+            JSON response with the error message.
 
         """
-        app.logger.info("Health check endpoint hit")
-        return make_response(jsonify({
-            'status': 'success',
-            'message': 'Service is running'
-        }), 200)
-
-    ##########################################################
-    #
-    # User Management
-    #
-    #########################################################
-
-    @app.route('/api/create-user', methods=['PUT'])
-    def create_user() -> Response:
-        """Register a new user account.
-
-        Expected JSON Input:
-            - username (str): The desired username.
-            - password (str): The desired password.
+        return json_response({
+            "status": "error",
+            "message": str(e)
+        }, 400)
 
-        Returns:
-            JSON response indicating the success of the user creation.
+    @app.errorhandler(Exception)
+    def handle_exception(e: Exception) -> Union[Response, HTTPException]:
+        """Turn any other unhandled error into a 500 response.
 
-        Raises:
-            400 error if the username or password is missing.
-            500 error if there is an issue creating the user in the database.
-        """
-        try:
-            data = request.get_json()
-            username = data.get("username")
-            password = data.get("password")
-
-            if not username or not password:
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Username and password are required"
-                }), 400)
-
-            Users.create_user(username, password)
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"User '{username}' created successfully"
-            }), 201)
-
-        except ValueError as e:
-            return make_response(jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 400)
-        except Exception as e:
-            app.logger.error(f"User creation failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while creating user",
-                "details": str(e)
-            }), 500)
+        HTTP errors raised by Flask itself (404, 405, ...) are passed through unchanged.
 
-    @app.route('/api/login', methods=['POST'])
-    def login() -> Response:
-        """Authenticate a user and log them in.
+        The exception and its traceback are logged; the client only gets a
+        generic message, so internal details never leak into the response.
 
-        Expected JSON Input:
-            - username (str): The username of the user.
-            - password (str): The password of the user.
+        Args:
+            e (Exception): The error that was raised.
 
         Returns:
-            JSON response indicating the success of the login attempt.
+            JSON response with a generic error message.
 
-        Raises:
-            401 error if the username or password is incorrect.
         """
-        try:
-            data = request.get_json()
-            username = data.get("username")
-            password = data.get("password")
-
-            if not username or not password:
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Username and password are required"
-                }), 400)
-
-            if Users.check_password(username, password):
-                user = Users.query.filter_by(username=username).first()
-                login_user(user)
-                return make_response(jsonify({
-                    "status": "success",
-                    "message": f"User '{username}' logged in successfully"
-                }), 200)
-            else:
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Invalid username or password"
-                }), 401)
-
-        except ValueError as e:
-            return make_response(jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 401)
-        except Exception as e:
-            app.logger.error(f"Login failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred during login",
-                "details": str(e)
-            }), 500)
+        if isinstance(e, HTTPException):
+            return e
+        app.logger.exception("Request to %s failed: %s", request.path, e)
+        return json_response(INTERNAL_ERROR, 500)
 
-    @app.route('/api/logout', methods=['POST'])
-    @login_required
-    def logout() -> Response:
-        """Log out the current user.
+    app.extensions["playlist_model"] = PlaylistModel()
+    app.extensions["user_cache"] = TTLCache(
+        maxsize=int(os.getenv("USER_CACHE_SIZE", 10_000)),
+        ttl=int(os.getenv("USER_CACHE_TTL", 60))
+    )
+    app.extensions["user_cache_lock"] = threading.RLock()
 
-        Returns:
-            JSON response indicating the success of the logout operation.
+    app.register_blueprint(bp)
 
-        """
-        logout_user()
-        return make_response(jsonify({
+    return app
+
+
+@bp.route('/health', methods=['GET'])
+def healthcheck() -> Response:
+    """Health check route to verify the service is running.
+
+    Returns:
+        JSON response indicating the health status of the service.
+
+    """
+    current_app.logger.debug("Health check endpoint hit")
+    return json_response(SERVICE_RUNNING, 200)
+
+
+##########################################################
+#
+# User Management
+#
+#########################################################
+
+@bp.route('/create-user', methods=['PUT'])
+def create_user() -> Response:
+    """Register a new user account.
+
+    Expected JSON Input:
+        - username (str): The desired username.
+        - password (str): The desired password.
+
+    Returns:
+        JSON response indicating the success of the user creation.
+
+    Raises:
+        400 error if the username or password is missing.
+        500 error if there is an issue creating the user in the database.
+    """
+    try:
+        credentials = Credentials.model_validate_json(request.get_data())
+    except ValidationError:
+        return json_response(USERNAME_AND_PASSWORD_REQUIRED, 400)
+    username, password = credentials.username, credentials.password
+
+    Users.create_user(username, password)
+    return json_response({
+        "status": "success",
+        "message": f"User '{username}' created successfully"
+    }, 201)
+
+
+@bp.route('/login', methods=['POST'])
+def login() -> Response:
+    """Authenticate a user and log them in.
+
+    Expected JSON Input:
+        - username (str): The username of the user.
+        - password (str): The password of the user.
+
+    Returns:
+        JSON response indicating the success of the login attempt.
+
+    Raises:
+        401 error if the username or password is incorrect.
+    """
+    try:
+        credentials = Credentials.model_validate_json(request.get_data())
+    except ValidationError:
+        return json_response(USERNAME_AND_PASSWORD_REQUIRED, 400)
+    username, password = credentials.username, credentials.password
+
+    try:
+        user = Users.authenticate(username, password)
+    except ValueError:
+        # Unknown users get the same response as a wrong password
+        user = None
+
+    if user:
+        login_user(user)
+        playlist_model.warm_cache()
+        return json_response({
             "status": "success",
-            "message": "User logged out successfully"
-        }), 200)
+            "message": f"User '{username}' logged in successfully"
+        }, 200)
+    else:
+        return json_response(INVALID_CREDENTIALS, 401)
 
-    @app.route('/api/change-password', methods=['POST'])
-    @login_required
-    def change_password() -> Response:
-        """Change the password for the current user.
 
-        Expected JSON Input:
-            - new_password (str): The new password to set.
+@bp.route('/logout', methods=['POST'])
+@login_required
+def logout() -> Response:
+    """Log out the current user.
 
-        Returns:
-            JSON response indicating the success of the password change.
+    Returns:
+        JSON response indicating the success of the logout operation.
 
-        Raises:
-            400 error if the new password is not provided.
-            500 error if there is an issue updating the password in the database.
-        """
-        try:
-            data = request.get_json()
-            new_password = data.get("new_password")
-
-            if not new_password:
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "New password is required"
-                }), 400)
-
-            username = current_user.username
-            Users.update_password(username, new_password)
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Password changed successfully"
-            }), 200)
-
-        except ValueError as e:
-            return make_response(jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 400)
-        except Exception as e:
-            app.logger.error(f"Password change failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while changing password",
-                "details": str(e)
-            }), 500)
+    """
+    invalidate_cached_user(current_user.username)
+    logout_user()
+    return json_response(LOGGED_OUT, 200)
 
-    @app.route('/api/reset-users', methods=['DELETE'])
-    def reset_users() -> Response:
-        """Recreate the users table to delete all users.
 
-        Returns:
-            JSON response indicating the success of recreating the Users table.
+@bp.route('/change-password', methods=['POST'])
+@login_required
+def change_password() -> Response:
+    """Change the password for the current user.
 
-        Raises:
-            500 error if there is an issue recreating the Users table.
-        """
-        try:
-            app.logger.info("Received request to recreate Users table")
-            with app.app_context():
-                Users.__table__.drop(db.engine)
-                Users.__table__.create(db.engine)
-            app.logger.info("Users table recreated successfully")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Users table recreated successfully"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Users table recreation failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while deleting users",
-                "details": str(e)
-            }), 500)
+    Expected JSON Input:
+        - new_password (str): The new password to set.
+
+    Returns:
+        JSON response indicating the success of the password change.
+
+    Raises:
+        400 error if the new password is not provided.
+        500 error if there is an issue updating the password in the database.
+    """
+    try:
+        new_password = NewPassword.model_validate_json(request.get_data()).new_password
+    except ValidationError:
+        return json_response(NEW_PASSWORD_REQUIRED, 400)
 
-    ##########################################################
-    #
-    # Songs
-    #
-    ##########################################################
+    # current_user is the shared, detached instance from the user cache; the
+    # update goes straight to the database and the cached entry is dropped
+    Users.update_password_by_id(current_user.id, new_password)
+    invalidate_cached_user(current_user.username)
+    return json_response({
+        "status": "success",
+        "message": "Password changed successfully"
+    }, 200)
 
-    @app.route('/api/reset-songs', methods=['DELETE'])
-    def reset_songs() -> Response:
-        """Recreate the songs table to delete songs.
 
-        Returns:
-            JSON response indicating the success of recreating the Songs table.
+@bp.route('/reset-users', methods=['DELETE'])
+def reset_users() -> Response:
+    """Recreate the users table to delete all users.
 
-        Raises:
-            500 error if there is an issue recreating the Songs table.
-        """
-        try:
-            app.logger.info("Received request to recreate Songs table")
-            with app.app_context():
-                Songs.__table__.drop(db.engine)
-                Songs.__table__.create(db.engine)
-            app.logger.info("Songs table recreated successfully")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Songs table recreated successfully"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Songs table recreation failed: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while deleting users",
-                "details": str(e)
-            }), 500)
+    Returns:
+        JSON response indicating the success of recreating the Users table.
 
+    Raises:
+        500 error if there is an issue recreating the Users table.
+    """
+    current_app.logger.info("Received request to recreate Users table")
+    truncate_table(Users)
+    invalidate_cached_user()
+    current_app.logger.info("Users table recreated successfully")
+    return json_response({
+        "status": "success",
+        "message": f"Users table recreated successfully"
+    }, 200)
+
+
+##########################################################
+#
+# Songs
+#
+##########################################################
+
+@bp.route('/reset-songs', methods=['DELETE'])
+def reset_songs() -> Response:
+    """Recreate the songs table to delete songs.
 
-    @app.route('/api/create-song', methods=['POST'])
-    @login_required
-    def add_song() -> Response:
-        """Route to add a new song to the catalog.
+    Returns:
+        JSON response indicating the success of recreating the Songs table.
 
-        Expected JSON Input:
-            - artist (str): The artist's name.
-            - title (str): The song title.
-            - year (int): The year the song was released.
-            - genre (str): The genre of the song.
-            - duration (int): The duration of the song in seconds.
+    Raises:
+        500 error if there is an issue recreating the Songs table.
+    """
+    current_app.logger.info("Received request to recreate Songs table")
+    truncate_table(Songs)
+    current_app.logger.info("Songs table recreated successfully")
+    return json_response({
+        "status": "success",
+        "message": f"Songs table recreated successfully"
+    }, 200)
+
+
+@bp.route('/create-song', methods=['POST'])
+@login_required
+def add_song() -> Response:
+    """Route to add a new song to the catalog.
+
+    Expected JSON Input:
+        - artist (str): The artist's name.
+        - title (str): The song title.
+        - year (int): The year the song was released.
+        - genre (str): The genre of the song.
+        - duration (int): The duration of the song in seconds.
 
-        Returns:
-            JSON response indicating the success of the song addition.
+    Returns:
+        JSON response indicating the success of the song addition.
 
-        Raises:
-            400 error if input validation fails.
-            500 error if there is an issue adding the song to the playlist.
+    Raises:
+        400 error if input validation fails.
+        500 error if there is an issue adding the song to the playlist.
 
-        """
-        app.logger.info("Received request to add a new song")
-
-        try:
-            data = request.get_json()
-
-            required_fields = ["artist", "title", "year", "genre", "duration"]
-            missing_fields = [field for field in required_fields if field not in data]
-
-            if missing_fields:
-                app.logger.warning(f"Missing required fields: {missing_fields}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Missing required fields: {', '.join(missing_fields)}"
-                }), 400)
-
-            artist = data["artist"]
-            title = data["title"]
-            year = data["year"]
-            genre = data["genre"]
-            duration = data["duration"]
-
-            if (
-                not isinstance(artist, str)
-                or not isinstance(title, str)
-                or not isinstance(year, int)
-                or not isinstance(genre, str)
-                or not isinstance(duration, int)
-            ):
-                app.logger.warning("Invalid input data types")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Invalid input types: artist/title/genre should be strings, year and duration should be integers"
-                }), 400)
-
-            app.logger.info(f"Adding song: {artist} - {title} ({year}), Genre: {genre}, Duration: {duration}s")
-            Songs.create_song(artist=artist, title=title, year=year, genre=genre, duration=duration)
-
-            app.logger.info(f"Song added successfully: {artist} - {title}")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Song '{title}' by {artist} added successfully"
-            }), 201)
-
-        except Exception as e:
-            app.logger.error(f"Failed to add song: {e}")
-            return make_response(jsonify({
+    """
+    current_app.logger.info("Received request to add a new song")
+
+    try:
+        song_in = SongIn.model_validate_json(request.get_data())
+    except ValidationError as e:
+        missing_fields = [err["loc"][0] for err in e.errors() if err["type"] == "missing"]
+
+        if missing_fields:
+            current_app.logger.warning("Missing required fields: %s", missing_fields)
+            return json_response({
                 "status": "error",
-                "message": "An internal error occurred while adding the song",
-                "details": str(e)
-            }), 500)
+                "message": f"Missing required fields: {', '.join(missing_fields)}"
+            }, 400)
 
+        current_app.logger.warning("Invalid input data types")
+        return json_response({
+            "status": "error",
+            "message": "Invalid input types: artist/title/genre should be strings, year and duration should be integers"
+        }, 400)
 
-    @app.route('/api/delete-song/<int:song_id>', methods=['DELETE'])
-    @login_required
-    def delete_song(song_id: int) -> Response:
-        """Route to delete a song by ID.
+    artist = song_in.artist
+    title = song_in.title
+    year = song_in.year
+    genre = song_in.genre
+    duration = song_in.duration
 
-        Path Parameter:
-            - song_id (int): The ID of the song to delete.
+    current_app.logger.info("Adding song: %s - %s (%s), Genre: %s, Duration: %ss", artist, title, year, genre, duration)
+    Songs.create_song(artist=artist, title=title, year=year, genre=genre, duration=duration)
 
-        Returns:
-            JSON response indicating success of the operation.
+    current_app.logger.info("Song added successfully: %s - %s", artist, title)
+    return json_response({
+        "status": "success",
+        "message": f"Song '{title}' by {artist} added successfully"
+    }, 201)
 
-        Raises:
-            400 error if the song does not exist.
-            500 error if there is an issue removing the song from the database.
 
-        """
-        try:
-            app.logger.info(f"Received request to delete song with ID {song_id}")
-
-            # Check if the song exists before attempting to delete
-            song = Songs.get_song_by_id(song_id)
-            if not song:
-                app.logger.warning(f"Song with ID {song_id} not found.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Song with ID {song_id} not found"
-                }), 400)
-
-            Songs.delete_song(song_id)
-            app.logger.info(f"Successfully deleted song with ID {song_id}")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Song with ID {song_id} deleted successfully"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to delete song: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while deleting the song",
-                "details": str(e)
-            }), 500)
+@bp.route('/delete-song/<int:song_id>', methods=['DELETE'])
+@login_required
+def delete_song(song_id: int) -> Response:
+    """Route to delete a song by ID.
 
+    Path Parameter:
+        - song_id (int): The ID of the song to delete.
 
-    @app.route('/api/get-all-songs-from-catalog', methods=['GET'])
-    @login_required
-    def get_all_songs() -> Response:
-        """Route to retrieve all songs in the catalog (non-deleted), with an option to sort by play count.
+    Returns:
+        JSON response indicating success of the operation.
 
-        Query Parameter:
-            - sort_by_play_count (bool, optional): If true, sort songs by play count.
+    Raises:
+        400 error if the song does not exist.
+        500 error if there is an issue removing the song from the database.
 
-        Returns:
-            JSON response containing the list of songs.
+    """
+    current_app.logger.info("Received request to delete song with ID %s", song_id)
 
-        Raises:
-            500 error if there is an issue retrieving songs from the catalog.
+    # Raises a ValueError, answered with a 400, if the song does not exist
+    Songs.delete_song(song_id)
+    current_app.logger.info("Successfully deleted song with ID %s", song_id)
 
-        """
-        try:
-            # Extract query parameter for sorting by play count
-            sort_by_play_count = request.args.get('sort_by_play_count', 'false').lower() == 'true'
+    return json_response({
+        "status": "success",
+        "message": f"Song with ID {song_id} deleted successfully"
+    }, 200)
 
-            app.logger.info(f"Received request to retrieve all songs from catalog (sort_by_play_count={sort_by_play_count})")
 
-            songs = Songs.get_all_songs(sort_by_play_count=sort_by_play_count)
+@bp.route('/get-all-songs-from-catalog', methods=['GET'])
+@login_required
+def get_all_songs() -> Response:
+    """Route to retrieve all songs in the catalog (non-deleted), with an option to sort by play count.
 
-            app.logger.info(f"Successfully retrieved {len(songs)} songs from the catalog")
+    Query Parameter:
+        - sort_by_play_count (bool, optional): If true, sort songs by play count.
 
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Songs retrieved successfully",
-                "songs": songs
-            }), 200)
+    Returns:
+        JSON response containing the list of songs.
 
-        except Exception as e:
-            app.logger.error(f"Failed to retrieve songs: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while retrieving songs",
-                "details": str(e)
-            }), 500)
+    Raises:
+        500 error if there is an issue retrieving songs from the catalog.
 
+    """
+    # Extract query parameter for sorting by play count
+    sort_by_play_count = request.args.get('sort_by_play_count', 'false').lower() == 'true'
 
-    @app.route('/api/get-song-from-catalog-by-id/<int:song_id>', methods=['GET'])
-    @login_required
-    def get_song_by_id(song_id: int) -> Response:
-        """Route to retrieve a song by its ID.
+    current_app.logger.info("Received request to retrieve all songs from catalog (sort_by_play_count=%s)", sort_by_play_count)
 
-        Path Parameter:
-            - song_id (int): The ID of the song.
+    songs = Songs.get_all_songs(sort_by_play_count=sort_by_play_count)
 
-        Returns:
-            JSON response containing the song details.
+    current_app.logger.info("Successfully retrieved %s songs from the catalog", len(songs))
 
-        Raises:
-            400 error if the song does not exist.
-            500 error if there is an issue retrieving the song.
+    return json_response({
+        "status": "success",
+        "message": "Songs retrieved successfully",
+        "songs": songs
+    }, 200)
 
-        """
-        try:
-            app.logger.info(f"Received request to retrieve song with ID {song_id}")
-
-            song = Songs.get_song_by_id(song_id)
-            if not song:
-                app.logger.warning(f"Song with ID {song_id} not found.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Song with ID {song_id} not found"
-                }), 400)
-
-            app.logger.info(f"Successfully retrieved song: {song.title} by {song.artist} (ID {song_id})")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Song retrieved successfully",
-                "song": song
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to retrieve song by ID: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while retrieving the song",
-                "details": str(e)
-            }), 500)
 
+@bp.route('/get-song-from-catalog-by-id/<int:song_id>', methods=['GET'])
+@login_required
+def get_song_by_id(song_id: int) -> Response:
+    """Route to retrieve a song by its ID.
 
-    @app.route('/api/get-song-from-catalog-by-compound-key', methods=['GET'])
-    @login_required
-    def get_song_by_compound_key() -> Response:
-        """Route to retrieve a song by its compound key (artist, title, year).
+    Path Parameter:
+        - song_id (int): The ID of the song.
 
-        Query Parameters:
-            - artist (str): The artist's name.
-            - title (str): The song title.
-            - year (int): The year the song was released.
+    Returns:
+        JSON response containing the song details.
 
-        Returns:
-            JSON response containing the song details.
+    Raises:
+        400 error if the song does not exist.
+        500 error if there is an issue retrieving the song.
 
-        Raises:
-            400 error if required query parameters are missing or invalid.
-            500 error if there is an issue retrieving the song.
+    """
+    current_app.logger.info("Received request to retrieve song with ID %s", song_id)
 
-        """
-        try:
-            artist = request.args.get('artist')
-            title = request.args.get('title')
-            year = request.args.get('year')
-
-            if not artist or not title or not year:
-                app.logger.warning("Missing required query parameters: artist, title, year")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Missing required query parameters: artist, title, year"
-                }), 400)
-
-            try:
-                year = int(year)
-            except ValueError:
-                app.logger.warning(f"Invalid year format: {year}. Year must be an integer.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Year must be an integer"
-                }), 400)
-
-            app.logger.info(f"Received request to retrieve song by compound key: {artist}, {title}, {year}")
-
-            song = Songs.get_song_by_compound_key(artist, title, year)
-            if not song:
-                app.logger.warning(f"Song not found: {artist} - {title} ({year})")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Song not found: {artist} - {title} ({year})"
-                }), 400)
-
-            app.logger.info(f"Successfully retrieved song: {song.title} by {song.artist} ({year})")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Song retrieved successfully",
-                "song": song
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to retrieve song by compound key: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while retrieving the song",
-                "details": str(e)
-            }), 500)
+    song = Songs.get_song_by_id(song_id)
+    if not song:
+        current_app.logger.warning("Song with ID %s not found.", song_id)
+        return json_response({
+            "status": "error",
+            "message": f"Song with ID {song_id} not found"
+        }, 400)
 
+    current_app.logger.info("Successfully retrieved song: %s by %s (ID %s)", song.title, song.artist, song_id)
 
-    @app.route('/api/get-random-song', methods=['GET'])
-    @login_required
-    def get_random_song() -> Response:
-        """Route to retrieve a random song from the catalog.
+    return json_response({
+        "status": "success",
+        "message": "Song retrieved successfully",
+        "song": song
+    }, 200)
 
-        Returns:
-            JSON response containing the details of a random song.
 
-        Raises:
-            400 error if no songs exist in the catalog.
-            500 error if there is an issue retrieving the song
+@bp.route('/get-song-from-catalog-by-compound-key', methods=['GET'])
+@login_required
+def get_song_by_compound_key() -> Response:
+    """Route to retrieve a song by its compound key (artist, title, year).
 
-        """
-        try:
-            app.logger.info("Received request to retrieve a random song from the catalog")
-
-            song = Songs.get_random_song()
-            if not song:
-                app.logger.warning("No songs found in the catalog.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "No songs available in the catalog"
-                }), 400)
-
-            app.logger.info(f"Successfully retrieved random song: {song.title} by {song.artist}")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Random song retrieved successfully",
-                "song": song
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to retrieve random song: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while retrieving a random song",
-                "details": str(e)
-            }), 500)
+    Query Parameters:
+        - artist (str): The artist's name.
+        - title (str): The song title.
+        - year (int): The year the song was released.
 
+    Returns:
+        JSON response containing the song details.
 
-    ############################################################
-    #
-    # Playlist Add / Remove
-    #
-    ############################################################
+    Raises:
+        400 error if required query parameters are missing or invalid.
+        500 error if there is an issue retrieving the song.
 
+    """
+    artist = request.args.get('artist')
+    title = request.args.get('title')
+    year = request.args.get('year')
 
-    @app.route('/api/add-song-to-playlist', methods=['POST'])
-    @login_required
-    def add_song_to_playlist() -> Response:
-        """Route to add a song to the playlist by compound key (artist, title, year).
+    if not artist or not title or not year:
+        current_app.logger.warning("Missing required query parameters: artist, title, year")
+        return json_response({
+            "status": "error",
+            "message": "Missing required query parameters: artist, title, year"
+        }, 400)
 
-        Expected JSON Input:
-            - artist (str): The artist's name.
-            - title (str): The song title.
-            - year (int): The year the song was released.
+    try:
+        year = int(year)
+    except ValueError:
+        current_app.logger.warning("Invalid year format: %s. Year must be an integer.", year)
+        return json_response({
+            "status": "error",
+            "message": "Year must be an integer"
+        }, 400)
 
-        Returns:
-            JSON response indicating success of the addition.
+    current_app.logger.info("Received request to retrieve song by compound key: %s, %s, %s", artist, title, year)
 
-        Raises:
-            400 error if required fields are missing or the song does not exist.
-            500 error if there is an issue adding the song to the playlist.
+    song = Songs.get_song_by_compound_key(artist, title, year)
+    if not song:
+        current_app.logger.warning("Song not found: %s - %s (%s)", artist, title, year)
+        return json_response({
+            "status": "error",
+            "message": f"Song not found: {artist} - {title} ({year})"
+        }, 400)
 
-        """
-        try:
-            app.logger.info("Received request to add song to playlist")
-
-            data = request.get_json()
-            required_fields = ["artist", "title", "year"]
-            missing_fields = [field for field in required_fields if field not in data]
-
-            if missing_fields:
-                app.logger.warning(f"Missing required fields: {missing_fields}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Missing required fields: {', '.join(missing_fields)}"
-                }), 400)
-
-            artist = data["artist"]
-            title = data["title"]
-
-            try:
-                year = int(data["year"])
-            except ValueError:
-                app.logger.warning(f"Invalid year format: {data['year']}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Year must be a valid integer"
-                }), 400)
-
-            app.logger.info(f"Looking up song: {artist} - {title} ({year})")
-            song = Songs.get_song_by_compound_key(artist, title, year)
-
-            if not song:
-                app.logger.warning(f"Song not found: {artist} - {title} ({year})")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Song '{title}' by {artist} ({year}) not found in catalog"
-                }), 400)
-
-            playlist_model.add_song_to_playlist(song)
-            app.logger.info(f"Successfully added song to playlist: {artist} - {title} ({year})")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Song '{title}' by {artist} ({year}) added to playlist"
-            }), 201)
-
-        except Exception as e:
-            app.logger.error(f"Failed to add song to playlist: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while adding the song to the playlist",
-                "details": str(e)
-            }), 500)
+    current_app.logger.info("Successfully retrieved song: %s by %s (%s)", song.title, song.artist, year)
 
+    return json_response({
+        "status": "success",
+        "message": "Song retrieved successfully",
+        "song": song
+    }, 200)
 
-    @app.route('/api/remove-song-from-playlist', methods=['DELETE'])
-    @login_required
-    def remove_song_by_song_id() -> Response:
-        """Route to remove a song from the playlist by compound key (artist, title, year).
 
-        Expected JSON Input:
-            - artist (str): The artist's name.
-            - title (str): The song title.
-            - year (int): The year the song was released.
+@bp.route('/get-random-song', methods=['GET'])
+@login_required
+def get_random_song() -> Response:
+    """Route to retrieve a random song from the catalog.
 
-        Returns:
-            JSON response indicating success of the removal.
+    Returns:
+        JSON response containing the details of a random song.
 
-        Raises:
-            400 error if required fields are missing or the song does not exist in the playlist.
-            500 error if there is an issue removing the song.
+    Raises:
+        400 error if no songs exist in the catalog.
+        500 error if there is an issue retrieving the song
 
-        """
-        try:
-            app.logger.info("Received request to remove song from playlist")
-
-            data = request.get_json()
-            required_fields = ["artist", "title", "year"]
-            missing_fields = [field for field in required_fields if field not in data]
-
-            if missing_fields:
-                app.logger.warning(f"Missing required fields: {missing_fields}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Missing required fields: {', '.join(missing_fields)}"
-                }), 400)
-
-            artist = data["artist"]
-            title = data["title"]
-
-            try:
-                year = int(data["year"])
-            except ValueError:
-                app.logger.warning(f"Invalid year format: {data['year']}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Year must be a valid integer"
-                }), 400)
-
-            app.logger.info(f"Looking up song to remove: {artist} - {title} ({year})")
-            song = Songs.get_song_by_compound_key(artist, title, year)
-
-            if not song:
-                app.logger.warning(f"Song not found in catalog: {artist} - {title} ({year})")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Song '{title}' by {artist} ({year}) not found in catalog"
-                }), 400)
-
-            playlist_model.remove_song_by_song_id(song.id)
-            app.logger.info(f"Successfully removed song from playlist: {artist} - {title} ({year})")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Song '{title}' by {artist} ({year}) removed from playlist"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to remove song from playlist: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while removing the song from the playlist",
-                "details": str(e)
-            }), 500)
+    """
+    current_app.logger.info("Received request to retrieve a random song from the catalog")
 
+    song = Songs.get_random_song()
+    if not song:
+        current_app.logger.warning("No songs found in the catalog.")
+        return json_response({
+            "status": "error",
+            "message": "No songs available in the catalog"
+        }, 400)
 
-    @app.route('/api/remove-song-from-playlist-by-track-number/<int:track_number>', methods=['DELETE'])
-    @login_required
-    def remove_song_by_track_number(track_number: int) -> Response:
-        """Route to remove a song from the playlist by track number.
+    current_app.logger.info("Successfully retrieved random song: %s by %s", song.title, song.artist)
 
-        Path Parameter:
-            - track_number (int): The track number of the song to remove.
+    return json_response({
+        "status": "success",
+        "message": "Random song retrieved successfully",
+        "song": song
+    }, 200)
 
-        Returns:
-            JSON response indicating success of the removal.
 
-        Raises:
-            404 error if the track number does not exist.
-            500 error if there is an issue removing the song.
+############################################################
+#
+# Playlist Add / Remove
+#
+############################################################
 
-        """
-        try:
-            app.logger.info(f"Received request to remove song at track number {track_number} from playlist")
+@bp.route('/add-song-to-playlist', methods=['POST'])
+@login_required
+def add_song_to_playlist() -> Response:
+    """Route to add a song to the playlist by compound key (artist, title, year).
 
-            playlist_model.remove_song_by_track_number(track_number)
+    Expected JSON Input:
+        - artist (str): The artist's name.
+        - title (str): The song title.
+        - year (int): The year the song was released.
 
-            app.logger.info(f"Successfully removed song at track number {track_number} from playlist")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Song at track number {track_number} removed from playlist"
-            }), 200)
+    Returns:
+        JSON response indicating success of the addition.
 
-        except ValueError as e:
-            app.logger.warning(f"Track number {track_number} not found in playlist: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": f"Track number {track_number} not found in playlist"
-            }), 404)
+    Raises:
+        400 error if required fields are missing or the song does not exist.
+        500 error if there is an issue adding the song to the playlist.
 
-        except Exception as e:
-            app.logger.error(f"Failed to remove song at track number {track_number}: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while removing the song from the playlist",
-                "details": str(e)
-            }), 500)
+    """
+    current_app.logger.info("Received request to add song to playlist")
 
+    data = request.get_json()
+    required_fields = ["artist", "title", "year"]
+    missing_fields = [field for field in required_fields if field not in data]
 
-    @app.route('/api/clear-playlist', methods=['POST'])
-    @login_required
-    def clear_playlist() -> Response:
-        """Route to clear all songs from the playlist.
+    if missing_fields:
+        current_app.logger.warning("Missing required fields: %s", missing_fields)
+        return json_response({
+            "status": "error",
+            "message": f"Missing required fields: {', '.join(missing_fields)}"
+        }, 400)
 
-        Returns:
-            JSON response indicating success of the operation.
+    artist = data["artist"]
+    title = data["title"]
 
-        Raises:
-            500 error if there is an issue clearing the playlist.
+    try:
+        year = int(data["year"])
+    except ValueError:
+        current_app.logger.warning("Invalid year format: %s", data['year'])
+        return json_response({
+            "status": "error",
+            "message": "Year must be a valid integer"
+        }, 400)
 
-        """
-        try:
-            app.logger.info("Received request to clear the playlist")
+    current_app.logger.info("Looking up song: %s - %s (%s)", artist, title, year)
+    song = Songs.get_song_by_compound_key(artist, title, year)
 
-            playlist_model.clear_playlist()
+    if not song:
+        current_app.logger.warning("Song not found: %s - %s (%s)", artist, title, year)
+        return json_response({
+            "status": "error",
+            "message": f"Song '{title}' by {artist} ({year}) not found in catalog"
+        }, 400)
 
-            app.logger.info("Successfully cleared the playlist")
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Playlist cleared"
-            }), 200)
+    playlist_model.add_song_to_playlist(song)
+    current_app.logger.info("Successfully added song to playlist: %s - %s (%s)", artist, title, year)
 
-        except Exception as e:
-            app.logger.error(f"Failed to clear playlist: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while clearing the playlist",
-                "details": str(e)
-            }), 500)
+    return json_response({
+        "status": "success",
+        "message": f"Song '{title}' by {artist} ({year}) added to playlist"
+    }, 201)
 
 
-    ############################################################
-    #
-    # Play Playlist
-    #
-    ############################################################
+@bp.route('/remove-song-from-playlist', methods=['DELETE'])
+@login_required
+def remove_song_by_song_id() -> Response:
+    """Route to remove a song from the playlist by compound key (artist, title, year).
 
+    Expected JSON Input:
+        - artist (str): The artist's name.
+        - title (str): The song title.
+        - year (int): The year the song was released.
 
-    @app.route('/api/play-current-song', methods=['POST'])
-    @login_required
-    def play_current_song() -> Response:
-        """Route to play the current song in the playlist.
+    Returns:
+        JSON response indicating success of the removal.
 
-        Returns:
-            JSON response indicating success of the operation.
+    Raises:
+        400 error if required fields are missing or the song does not exist in the playlist.
+        500 error if there is an issue removing the song.
 
-        Raises:
-            404 error if there is no current song.
-            500 error if there is an issue playing the current song.
+    """
+    current_app.logger.info("Received request to remove song from playlist")
 
-        """
-        try:
-            app.logger.info("Received request to play the current song")
-
-            current_song = playlist_model.get_current_song()
-            if not current_song:
-                app.logger.warning("No current song found in the playlist")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "No current song found in the playlist"
-                }), 404)
-
-            playlist_model.play_current_song()
-            app.logger.info(f"Now playing: {current_song.artist} - {current_song.title} ({current_song.year})")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Now playing current song",
-                "song": {
-                    "id": current_song.id,
-                    "artist": current_song.artist,
-                    "title": current_song.title,
-                    "year": current_song.year,
-                    "genre": current_song.genre,
-                    "duration": current_song.duration
-                }
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to play current song: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while playing the current song",
-                "details": str(e)
-            }), 500)
+    data = request.get_json()
+    required_fields = ["artist", "title", "year"]
+    missing_fields = [field for field in required_fields if field not in data]
 
+    if missing_fields:
+        current_app.logger.warning("Missing required fields: %s", missing_fields)
+        return json_response({
+            "status": "error",
+            "message": f"Missing required fields: {', '.join(missing_fields)}"
+        }, 400)
 
-    @app.route('/api/play-entire-playlist', methods=['POST'])
-    @login_required
-    def play_entire_playlist() -> Response:
-        """Route to play all songs in the playlist.
+    artist = data["artist"]
+    title = data["title"]
 
-        Returns:
-            JSON response indicating success of the operation.
+    try:
+        year = int(data["year"])
+    except ValueError:
+        current_app.logger.warning("Invalid year format: %s", data['year'])
+        return json_response({
+            "status": "error",
+            "message": "Year must be a valid integer"
+        }, 400)
 
-        Raises:
-            400 error if the playlist is empty.
-            500 error if there is an issue playing the playlist.
+    current_app.logger.info("Looking up song to remove: %s - %s (%s)", artist, title, year)
+    song = Songs.get_song_by_compound_key(artist, title, year)
 
-        """
-        try:
-            app.logger.info("Received request to play the entire playlist")
-
-            if playlist_model.check_if_empty():
-                app.logger.warning("Cannot play playlist: No songs available")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Cannot play playlist: No songs available"
-                }), 400)
-
-            playlist_model.play_entire_playlist()
-            app.logger.info("Playing entire playlist")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Playing entire playlist"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to play entire playlist: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while playing the playlist",
-                "details": str(e)
-            }), 500)
+    if not song:
+        current_app.logger.warning("Song not found in catalog: %s - %s (%s)", artist, title, year)
+        return json_response({
+            "status": "error",
+            "message": f"Song '{title}' by {artist} ({year}) not found in catalog"
+        }, 400)
 
+    playlist_model.remove_song_by_song_id(song.id)
+    current_app.logger.info("Successfully removed song from playlist: %s - %s (%s)", artist, title, year)
 
-    @app.route('/api/play-rest-of-playlist', methods=['POST'])
-    @login_required
-    def play_rest_of_playlist() -> Response:
-        """Route to play the rest of the playlist from the current track.
+    return json_response({
+        "status": "success",
+        "message": f"Song '{title}' by {artist} ({year}) removed from playlist"
+    }, 200)
 
-        Returns:
-            JSON response indicating success of the operation.
 
-        Raises:
-            400 error if the playlist is empty or if no current song is playing.
-            500 error if there is an issue playing the rest of the playlist.
+@bp.route('/remove-song-from-playlist-by-track-number/<int:track_number>', methods=['DELETE'])
+@login_required
+def remove_song_by_track_number(track_number: int) -> Response:
+    """Route to remove a song from the playlist by track number.
 
-        """
-        try:
-            app.logger.info("Received request to play the rest of the playlist")
-
-            if playlist_model.check_if_empty():
-                app.logger.warning("Cannot play rest of playlist: No songs available")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Cannot play rest of playlist: No songs available"
-                }), 400)
-
-            if not playlist_model.get_current_song():
-                app.logger.warning("No current song playing. Cannot continue playlist.")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "No current song playing. Cannot continue playlist."
-                }), 400)
-
-            playlist_model.play_rest_of_playlist()
-            app.logger.info("Playing rest of the playlist")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Playing rest of the playlist"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to play rest of the playlist: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while playing the rest of the playlist",
-                "details": str(e)
-            }), 500)
+    Path Parameter:
+        - track_number (int): The track number of the song to remove.
 
+    Returns:
+        JSON response indicating success of the removal.
 
-    @app.route('/api/rewind-playlist', methods=['POST'])
-    @login_required
-    def rewind_playlist() -> Response:
-        """Route to rewind the playlist to the first song.
+    Raises:
+        404 error if the track number does not exist.
+        500 error if there is an issue removing the song.
 
-        Returns:
-            JSON response indicating success of the operation.
+    """
+    try:
+        current_app.logger.info("Received request to remove song at track number %s from playlist", track_number)
 
-        Raises:
-            400 error if the playlist is empty.
-            500 error if there is an issue rewinding the playlist.
+        playlist_model.remove_song_by_track_number(track_number)
 
-        """
-        try:
-            app.logger.info("Received request to rewind the playlist")
-
-            if playlist_model.check_if_empty():
-                app.logger.warning("Cannot rewind: No songs in playlist")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Cannot rewind: No songs in playlist"
-                }), 400)
-
-            playlist_model.rewind_playlist()
-            app.logger.info("Playlist successfully rewound to the first song")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": "Playlist rewound to the first song"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to rewind playlist: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while rewinding the playlist",
-                "details": str(e)
-            }), 500)
+        current_app.logger.info("Successfully removed song at track number %s from playlist", track_number)
+        return json_response({
+            "status": "success",
+            "message": f"Song at track number {track_number} removed from playlist"
+        }, 200)
 
+    except ValueError as e:
+        current_app.logger.warning("Track number %s not found in playlist: %s", track_number, e)
+        return json_response({
+            "status": "error",
+            "message": f"Track number {track_number} not found in playlist"
+        }, 404)
 
-    @app.route('/api/go-to-track-number/<int:track_number>', methods=['POST'])
-    @login_required
-    def go_to_track_number(track_number: int) -> Response:
-        """Route to set the playlist to start playing from a specific track number.
 
-        Path Parameter:
-            - track_number (int): The track number to set as the current song.
+@bp.route('/clear-playlist', methods=['POST'])
+@login_required
+def clear_playlist() -> Response:
+    """Route to clear all songs from the playlist.
 
-        Returns:
-            JSON response indicating success or an error message.
+    Returns:
+        JSON response indicating success of the operation.
 
-        Raises:
-            400 error if the track number is invalid.
-            500 error if there is an issue updating the track number.
-        """
-        try:
-            app.logger.info(f"Received request to go to track number {track_number}")
-
-            if not playlist_model.is_valid_track_number(track_number):
-                app.logger.warning(f"Invalid track number: {track_number}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Invalid track number: {track_number}. Please provide a valid track number."
-                }), 400)
-
-            playlist_model.go_to_track_number(track_number)
-            app.logger.info(f"Playlist set to track number {track_number}")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Now playing from track number {track_number}"
-            }), 200)
-
-        except ValueError as e:
-            app.logger.warning(f"Failed to set track number {track_number}: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 400)
+    Raises:
+        500 error if there is an issue clearing the playlist.
 
-        except Exception as e:
-            app.logger.error(f"Internal error while going to track number {track_number}: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while changing the track number",
-                "details": str(e)
-            }), 500)
+    """
+    current_app.logger.info("Received request to clear the playlist")
 
+    playlist_model.clear_playlist()
 
-    @app.route('/api/go-to-random-track', methods=['POST'])
-    @login_required
-    def go_to_random_track() -> Response:
-        """Route to set the playlist to start playing from a random track number.
+    current_app.logger.info("Successfully cleared the playlist")
+    return json_response({
+        "status": "success",
+        "message": "Playlist cleared"
+    }, 200)
 
-        Returns:
-            JSON response indicating success or an error message.
 
-        Raises:
-            400 error if the playlist is empty.
-            500 error if there is an issue selecting a random track.
+############################################################
+#
+# Play Playlist
+#
+############################################################
 
-        """
-        try:
-            app.logger.info("Received request to go to a random track")
-
-            if playlist_model.get_playlist_length() == 0:
-                app.logger.warning("Attempted to go to a random track but the playlist is empty")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": "Cannot select a random track. The playlist is empty."
-                }), 400)
-
-            playlist_model.go_to_random_track()
-            app.logger.info(f"Playlist set to random track number {playlist_model.current_track_number}")
-
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Now playing from random track number {playlist_model.current_track_number}"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Internal error while selecting a random track: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while selecting a random track",
-                "details": str(e)
-            }), 500)
+@bp.route('/play-current-song', methods=['POST'])
+@login_required
+def play_current_song() -> Response:
+    """Route to play the current song in the playlist.
 
+    Returns:
+        JSON response indicating success of the operation.
 
-    ############################################################
-    #
-    # View Playlist
-    #
-    ############################################################
+    Raises:
+        404 error if there is no current song.
+        500 error if there is an issue playing the current song.
 
+    """
+    current_app.logger.info("Received request to play the current song")
 
-    @app.route('/api/get-all-songs-from-playlist', methods=['GET'])
-    @login_required
-    def get_all_songs_from_playlist() -> Response:
-        """Retrieve all songs in the playlist.
+    current_song = playlist_model.get_current_song()
+    if not current_song:
+        current_app.logger.warning("No current song found in the playlist")
+        return json_response({
+            "status": "error",
+            "message": "No current song found in the playlist"
+        }, 404)
+
+    playlist_model.play_current_song()
+    current_app.logger.info("Now playing: %s - %s (%s)", current_song.artist, current_song.title, current_song.year)
+
+    return json_response({
+        "status": "success",
+        "message": "Now playing current song",
+        "song": {
+            "id": current_song.id,
+            "artist": current_song.artist,
+            "title": current_song.title,
+            "year": current_song.year,
+            "genre": current_song.genre,
+            "duration": current_song.duration
+        }
+    }, 200)
+
+
+@bp.route('/play-entire-playlist', methods=['POST'])
+@login_required
+def play_entire_playlist() -> Response:
+    """Route to play all songs in the playlist.
 
-        Returns:
-            JSON response containing the list of songs.
+    Returns:
+        JSON response indicating success of the operation.
 
-        Raises:
-            500 error if there is an issue retrieving the playlist.
+    Raises:
+        400 error if the playlist is empty.
+        500 error if there is an issue playing the playlist.
 
-        """
-        try:
-            app.logger.info("Received request to retrieve all songs from the playlist.")
+    """
+    current_app.logger.info("Received request to play the entire playlist")
 
-            songs = playlist_model.get_all_songs()
+    if playlist_model.check_if_empty():
+        current_app.logger.warning("Cannot play playlist: No songs available")
+        return json_response({
+            "status": "error",
+            "message": "Cannot play playlist: No songs available"
+        }, 400)
 
-            app.logger.info(f"Successfully retrieved {len(songs)} songs from the playlist.")
-            return make_response(jsonify({
-                "status": "success",
-                "songs": songs
-            }), 200)
+    playlist_model.play_entire_playlist()
+    current_app.logger.info("Playing entire playlist")
 
-        except Exception as e:
-            app.logger.error(f"Failed to retrieve songs from playlist: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while retrieving the playlist",
-                "details": str(e)
-            }), 500)
+    return json_response({
+        "status": "success",
+        "message": "Playing entire playlist"
+    }, 200)
 
 
-    @app.route('/api/get-song-from-playlist-by-track-number/<int:track_number>', methods=['GET'])
-    @login_required
-    def get_song_by_track_number(track_number: int) -> Response:
-        """Retrieve a song from the playlist by track number.
+@bp.route('/play-rest-of-playlist', methods=['POST'])
+@login_required
+def play_rest_of_playlist() -> Response:
+    """Route to play the rest of the playlist from the current track.
 
-        Path Parameter:
-            - track_number (int): The track number of the song.
+    Returns:
+        JSON response indicating success of the operation.
 
-        Returns:
-            JSON response containing song details.
+    Raises:
+        400 error if the playlist is empty or if no current song is playing.
+        500 error if there is an issue playing the rest of the playlist.
 
-        Raises:
-            404 error if the track number is not found.
-            500 error if there is an issue retrieving the song.
+    """
+    current_app.logger.info("Received request to play the rest of the playlist")
 
-        """
-        try:
-            app.logger.info(f"Received request to retrieve song at track number {track_number}.")
+    if playlist_model.check_if_empty():
+        current_app.logger.warning("Cannot play rest of playlist: No songs available")
+        return json_response({
+            "status": "error",
+            "message": "Cannot play rest of playlist: No songs available"
+        }, 400)
 
-            song = playlist_model.get_song_by_track_number(track_number)
+    if not playlist_model.get_current_song():
+        current_app.logger.warning("No current song playing. Cannot continue playlist.")
+        return json_response({
+            "status": "error",
+            "message": "No current song playing. Cannot continue playlist."
+        }, 400)
 
-            app.logger.info(f"Successfully retrieved song: {song.artist} - {song.title} (Track {track_number}).")
-            return make_response(jsonify({
-                "status": "success",
-                "song": song
-            }), 200)
+    playlist_model.play_rest_of_playlist()
+    current_app.logger.info("Playing rest of the playlist")
 
-        except ValueError as e:
-            app.logger.warning(f"Track number {track_number} not found: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 404)
+    return json_response({
+        "status": "success",
+        "message": "Playing rest of the playlist"
+    }, 200)
 
-        except Exception as e:
-            app.logger.error(f"Failed to retrieve song by track number {track_number}: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while retrieving the song",
-                "details": str(e)
-            }), 500)
 
+@bp.route('/rewind-playlist', methods=['POST'])
+@login_required
+def rewind_playlist() -> Response:
+    """Route to rewind the playlist to the first song.
 
-    @app.route('/api/get-current-song', methods=['GET'])
-    @login_required
-    def get_current_song() -> Response:
-        """Retrieve the current song being played.
+    Returns:
+        JSON response indicating success of the operation.
 
-        Returns:
-            JSON response containing current song details.
+    Raises:
+        400 error if the playlist is empty.
+        500 error if there is an issue rewinding the playlist.
 
-        Raises:
-            500 error if there is an issue retrieving the current song.
+    """
+    current_app.logger.info("Received request to rewind the playlist")
 
-        """
-        try:
-            app.logger.info("Received request to retrieve the current song.")
+    if playlist_model.check_if_empty():
+        current_app.logger.warning("Cannot rewind: No songs in playlist")
+        return json_response({
+            "status": "error",
+            "message": "Cannot rewind: No songs in playlist"
+        }, 400)
 
-            current_song = playlist_model.get_current_song()
+    playlist_model.rewind_playlist()
+    current_app.logger.info("Playlist successfully rewound to the first song")
 
-            app.logger.info(f"Successfully retrieved current song: {current_song.artist} - {current_song.title}.")
-            return make_response(jsonify({
-                "status": "success",
-                "current_song": current_song
-            }), 200)
+    return json_response({
+        "status": "success",
+        "message": "Playlist rewound to the first song"
+    }, 200)
 
-        except Exception as e:
-            app.logger.error(f"Failed to retrieve current song: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while retrieving the current song",
-                "details": str(e)
-            }), 500)
 
+@bp.route('/go-to-track-number/<int:track_number>', methods=['POST'])
+@login_required
+def go_to_track_number(track_number: int) -> Response:
+    """Route to set the playlist to start playing from a specific track number.
 
-    @app.route('/api/get-playlist-length-duration', methods=['GET'])
-    @login_required
-    def get_playlist_length_and_duration() -> Response:
-        """Retrieve the length (number of songs) and total duration of the playlist.
+    Path Parameter:
+        - track_number (int): The track number to set as the current song.
 
-        Returns:
-            JSON response containing the playlist length and total duration.
+    Returns:
+        JSON response indicating success or an error message.
 
-        Raises:
-            500 error if there is an issue retrieving playlist information.
+    Raises:
+        400 error if the track number is invalid.
+        500 error if there is an issue updating the track number.
+    """
+    try:
+        current_app.logger.info("Received request to go to track number %s", track_number)
 
-        """
-        try:
-            app.logger.info("Received request to retrieve playlist length and duration.")
-
-            playlist_length = playlist_model.get_playlist_length()
-            playlist_duration = playlist_model.get_playlist_duration()
-
-            app.logger.info(f"Playlist contains {playlist_length} songs with a total duration of {playlist_duration} seconds.")
-            return make_response(jsonify({
-                "status": "success",
-                "playlist_length": playlist_length,
-                "playlist_duration": playlist_duration
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to retrieve playlist length and duration: {e}")
-            return make_response(jsonify({
+        if not playlist_model.is_valid_track_number(track_number):
+            current_app.logger.warning("Invalid track number: %s", track_number)
+            return json_response({
                 "status": "error",
-                "message": "An internal error occurred while retrieving playlist details",
-                "details": str(e)
-            }), 500)
+                "message": f"Invalid track number: {track_number}. Please provide a valid track number."
+            }, 400)
 
+        playlist_model.go_to_track_number(track_number)
+        current_app.logger.info("Playlist set to track number %s", track_number)
 
-    ############################################################
-    #
-    # Arrange Playlist
-    #
-    ############################################################
+        return json_response({
+            "status": "success",
+            "message": f"Now playing from track number {track_number}"
+        }, 200)
 
+    except ValueError as e:
+        current_app.logger.warning("Failed to set track number %s: %s", track_number, e)
+        return json_response({
+            "status": "error",
+            "message": str(e)
+        }, 400)
 
-    @app.route('/api/move-song-to-beginning', methods=['POST'])
-    @login_required
-    def move_song_to_beginning() -> Response:
-        """Move a song to the beginning of the playlist.
 
-        Expected JSON Input:
-            - artist (str): The artist of the song.
-            - title (str): The title of the song.
-            - year (int): The year the song was released.
+@bp.route('/go-to-random-track', methods=['POST'])
+@login_required
+def go_to_random_track() -> Response:
+    """Route to set the playlist to start playing from a random track number.
 
-        Returns:
-            Response: JSON response indicating success or an error message.
+    Returns:
+        JSON response indicating success or an error message.
 
-        Raises:
-            400 error if required fields are missing.
-            500 error if an error occurs while updating the playlist.
+    Raises:
+        400 error if the playlist is empty.
+        500 error if there is an issue selecting a random track.
 
-        """
-        try:
-            data = request.get_json()
-
-            required_fields = ["artist", "title", "year"]
-            missing_fields = [field for field in required_fields if field not in data]
-
-            if missing_fields:
-                app.logger.warning(f"Missing required fields: {missing_fields}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Missing required fields: {', '.join(missing_fields)}"
-                }), 400)
-
-            artist, title, year = data["artist"], data["title"], data["year"]
-            app.logger.info(f"Received request to move song to beginning: {artist} - {title} ({year})")
-
-            song = Songs.get_song_by_compound_key(artist, title, year)
-            playlist_model.move_song_to_beginning(song.id)
-
-            app.logger.info(f"Successfully moved song to beginning: {artist} - {title} ({year})")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Song '{title}' by {artist} moved to beginning"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to move song to beginning: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while moving the song",
-                "details": str(e)
-            }), 500)
+    """
+    current_app.logger.info("Received request to go to a random track")
 
+    if playlist_model.get_playlist_length() == 0:
+        current_app.logger.warning("Attempted to go to a random track but the playlist is empty")
+        return json_response({
+            "status": "error",
+            "message": "Cannot select a random track. The playlist is empty."
+        }, 400)
 
-    @app.route('/api/move-song-to-end', methods=['POST'])
-    @login_required
-    def move_song_to_end() -> Response:
-        """Move a song to the end of the playlist.
+    playlist_model.go_to_random_track()
+    current_app.logger.info("Playlist set to random track number %s", playlist_model.current_track_number)
 
-        Expected JSON Input:
-            - artist (str): The artist of the song.
-            - title (str): The title of the song.
-            - year (int): The year the song was released.
+    return json_response({
+        "status": "success",
+        "message": f"Now playing from random track number {playlist_model.current_track_number}"
+    }, 200)
 
-        Returns:
-            Response: JSON response indicating success or an error message.
 
-        Raises:
-            400 error if required fields are missing.
-            500 if an error occurs while updating the playlist.
+############################################################
+#
+# View Playlist
+#
+############################################################
 
-        """
-        try:
-            data = request.get_json()
-
-            required_fields = ["artist", "title", "year"]
-            missing_fields = [field for field in required_fields if field not in data]
-
-            if missing_fields:
-                app.logger.warning(f"Missing required fields: {missing_fields}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Missing required fields: {', '.join(missing_fields)}"
-                }), 400)
-
-            artist, title, year = data["artist"], data["title"], data["year"]
-            app.logger.info(f"Received request to move song to end: {artist} - {title} ({year})")
-
-            song = Songs.get_song_by_compound_key(artist, title, year)
-            playlist_model.move_song_to_end(song.id)
-
-            app.logger.info(f"Successfully moved song to end: {artist} - {title} ({year})")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Song '{title}' by {artist} moved to end"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to move song to end: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while moving the song",
-                "details": str(e)
-            }), 500)
+@bp.route('/get-all-songs-from-playlist', methods=['GET'])
+@login_required
+def get_all_songs_from_playlist() -> Response:
+    """Retrieve all songs in the playlist.
 
+    Returns:
+        JSON response containing the list of songs.
 
-    @app.route('/api/move-song-to-track-number', methods=['POST'])
-    @login_required
-    def move_song_to_track_number() -> Response:
-        """Move a song to a specific track number in the playlist.
+    Raises:
+        500 error if there is an issue retrieving the playlist.
 
-        Expected JSON Input:
-            - artist (str): The artist of the song.
-            - title (str): The title of the song.
-            - year (int): The year the song was released.
-            - track_number (int): The new track number to move the song to.
+    """
+    current_app.logger.info("Received request to retrieve all songs from the playlist.")
 
-        Returns:
-            Response: JSON response indicating success or an error message.
+    songs = playlist_model.get_all_songs()
 
-        Raises:
-            400 error if required fields are missing.
-            500 error if an error occurs while updating the playlist.
-        """
-        try:
-            data = request.get_json()
-
-            required_fields = ["artist", "title", "year", "track_number"]
-            missing_fields = [field for field in required_fields if field not in data]
-
-            if missing_fields:
-                app.logger.warning(f"Missing required fields: {missing_fields}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Missing required fields: {', '.join(missing_fields)}"
-                }), 400)
-
-            artist, title, year, track_number = data["artist"], data["title"], data["year"], data["track_number"]
-            app.logger.info(f"Received request to move song to track number {track_number}: {artist} - {title} ({year})")
-
-            song = Songs.get_song_by_compound_key(artist, title, year)
-            playlist_model.move_song_to_track_number(song.id, track_number)
-
-            app.logger.info(f"Successfully moved song to track {track_number}: {artist} - {title} ({year})")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Song '{title}' by {artist} moved to track {track_number}"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to move song to track number: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while moving the song",
-                "details": str(e)
-            }), 500)
+    current_app.logger.info("Successfully retrieved %s songs from the playlist.", len(songs))
+    return json_response({
+        "status": "success",
+        "songs": songs
+    }, 200)
 
 
-    @app.route('/api/swap-songs-in-playlist', methods=['POST'])
-    @login_required
-    def swap_songs_in_playlist() -> Response:
-        """Swap two songs in the playlist by their track numbers.
+@bp.route('/get-song-from-playlist-by-track-number/<int:track_number>', methods=['GET'])
+@login_required
+def get_song_by_track_number(track_number: int) -> Response:
+    """Retrieve a song from the playlist by track number.
 
-        Expected JSON Input:
-            - track_number_1 (int): The track number of the first song.
-            - track_number_2 (int): The track number of the second song.
+    Path Parameter:
+        - track_number (int): The track number of the song.
 
-        Returns:
-            Response: JSON response indicating success or an error message.
+    Returns:
+        JSON response containing song details.
 
-        Raises:
-            400 error if required fields are missing.
-            500 error if an error occurs while swapping songs in the playlist.
-        """
-        try:
-            data = request.get_json()
-
-            required_fields = ["track_number_1", "track_number_2"]
-            missing_fields = [field for field in required_fields if field not in data]
-
-            if missing_fields:
-                app.logger.warning(f"Missing required fields: {missing_fields}")
-                return make_response(jsonify({
-                    "status": "error",
-                    "message": f"Missing required fields: {', '.join(missing_fields)}"
-                }), 400)
-
-            track_number_1, track_number_2 = data["track_number_1"], data["track_number_2"]
-            app.logger.info(f"Received request to swap songs at track numbers {track_number_1} and {track_number_2}")
-
-            song_1 = playlist_model.get_song_by_track_number(track_number_1)
-            song_2 = playlist_model.get_song_by_track_number(track_number_2)
-            playlist_model.swap_songs_in_playlist(song_1.id, song_2.id)
-
-            app.logger.info(f"Successfully swapped songs: {song_1.artist} - {song_1.title} <-> {song_2.artist} - {song_2.title}")
-            return make_response(jsonify({
-                "status": "success",
-                "message": f"Swapped songs: {song_1.artist} - {song_1.title} <-> {song_2.artist} - {song_2.title}"
-            }), 200)
-
-        except Exception as e:
-            app.logger.error(f"Failed to swap songs in playlist: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while swapping songs",
-                "details": str(e)
-            }), 500)
+    Raises:
+        404 error if the track number is not found.
+        500 error if there is an issue retrieving the song.
 
+    """
+    try:
+        current_app.logger.info("Received request to retrieve song at track number %s.", track_number)
 
+        song = playlist_model.get_song_by_track_number(track_number)
 
-    ############################################################
-    #
-    # Leaderboard / Stats
-    #
-    ############################################################
+        current_app.logger.info("Successfully retrieved song: %s - %s (Track %s).", song.artist, song.title, track_number)
+        return json_response({
+            "status": "success",
+            "song": song
+        }, 200)
 
+    except ValueError as e:
+        current_app.logger.warning("Track number %s not found: %s", track_number, e)
+        return json_response({
+            "status": "error",
+            "message": str(e)
+        }, 404)
 
-    @app.route('/api/song-leaderboard', methods=['GET'])
-    def get_song_leaderboard() -> Response:
-        """
-        Route to retrieve a leaderboard of songs sorted by play count.
 
-        Returns:
-            JSON response with a sorted leaderboard of songs.
+@bp.route('/get-current-song', methods=['GET'])
+@login_required
+def get_current_song() -> Response:
+    """Retrieve the current song being played.
 
-        Raises:
-            500 error if there is an issue generating the leaderboard.
+    Returns:
+        JSON response containing current song details.
 
-        """
-        try:
-            app.logger.info("Received request to generate song leaderboard")
+    Raises:
+        500 error if there is an issue retrieving the current song.
 
-            leaderboard_data = Songs.get_all_songs(sort_by_play_count=True)
+    """
+    current_app.logger.info("Received request to retrieve the current song.")
 
-            app.logger.info(f"Successfully generated song leaderboard with {len(leaderboard_data)} entries")
-            return make_response(jsonify({
-                "status": "success",
-                "leaderboard": leaderboard_data
-            }), 200)
+    current_song = playlist_model.get_current_song()
 
-        except Exception as e:
-            app.logger.error(f"Failed to generate song leaderboard: {e}")
-            return make_response(jsonify({
-                "status": "error",
-                "message": "An internal error occurred while generating the leaderboard",
-                "details": str(e)
-            }), 500)
+    current_app.logger.info("Successfully retrieved current song: %s - %s.", current_song.artist, current_song.title)
+    return json_response({
+        "status": "success",
+        "current_song": current_song
+    }, 200)
+
+
+@bp.route('/get-playlist-length-duration', methods=['GET'])
+@login_required
+def get_playlist_length_and_duration() -> Response:
+    """Retrieve the length (number of songs) and total duration of the playlist.
+
+    Returns:
+        JSON response containing the playlist length and total duration.
+
+    Raises:
+        500 error if there is an issue retrieving playlist information.
+
+    """
+    current_app.logger.info("Received request to retrieve playlist length and duration.")
+
+    playlist_length = playlist_model.get_playlist_length()
+    playlist_duration = playlist_model.get_playlist_duration()
+
+    current_app.logger.info("Playlist contains %s songs with a total duration of %s seconds.", playlist_length, playlist_duration)
+    return json_response({
+        "status": "success",
+        "playlist_length": playlist_length,
+        "playlist_duration": playlist_duration
+    }, 200)
+
+
+############################################################
+#
+# Arrange Playlist
+#
+############################################################
+
+@bp.route('/move-song-to-beginning', methods=['POST'])
+@login_required
+def move_song_to_beginning() -> Response:
+    """Move a song to the beginning of the playlist.
+
+    Expected JSON Input:
+        - artist (str): The artist of the song.
+        - title (str): The title of the song.
+        - year (int): The year the song was released.
+
+    Returns:
+        Response: JSON response indicating success or an error message.
+
+    Raises:
+        400 error if required fields are missing.
+        500 error if an error occurs while updating the playlist.
+
+    """
+    data = request.get_json()
+
+    required_fields = ["artist", "title", "year"]
+    missing_fields = [field for field in required_fields if field not in data]
+
+    if missing_fields:
+        current_app.logger.warning("Missing required fields: %s", missing_fields)
+        return json_response({
+            "status": "error",
+            "message": f"Missing required fields: {', '.join(missing_fields)}"
+        }, 400)
+
+    artist, title, year = data["artist"], data["title"], data["year"]
+    current_app.logger.info("Received request to move song to beginning: %s - %s (%s)", artist, title, year)
+
+    song = Songs.get_song_by_compound_key(artist, title, year)
+    playlist_model.move_song_to_beginning(song.id)
+
+    current_app.logger.info("Successfully moved song to beginning: %s - %s (%s)", artist, title, year)
+    return json_response({
+        "status": "success",
+        "message": f"Song '{title}' by {artist} moved to beginning"
+    }, 200)
+
+
+@bp.route('/move-song-to-end', methods=['POST'])
+@login_required
+def move_song_to_end() -> Response:
+    """Move a song to the end of the playlist.
+
+    Expected JSON Input:
+        - artist (str): The artist of the song.
+        - title (str): The title of the song.
+        - year (int): The year the song was released.
+
+    Returns:
+        Response: JSON response indicating success or an error message.
+
+    Raises:
+        400 error if required fields are missing.
+        500 if an error occurs while updating the playlist.
+
+    """
+    data = request.get_json()
+
+    required_fields = ["artist", "title", "year"]
+    missing_fields = [field for field in required_fields if field not in data]
+
+    if missing_fields:
+        current_app.logger.warning("Missing required fields: %s", missing_fields)
+        return json_response({
+            "status": "error",
+            "message": f"Missing required fields: {', '.join(missing_fields)}"
+        }, 400)
+
+    artist, title, year = data["artist"], data["title"], data["year"]
+    current_app.logger.info("Received request to move song to end: %s - %s (%s)", artist, title, year)
+
+    song = Songs.get_song_by_compound_key(artist, title, year)
+    playlist_model.move_song_to_end(song.id)
+
+    current_app.logger.info("Successfully moved song to end: %s - %s (%s)", artist, title, year)
+    return json_response({
+        "status": "success",
+        "message": f"Song '{title}' by {artist} moved to end"
+    }, 200)
+
+
+@bp.route('/move-song-to-track-number', methods=['POST'])
+@login_required
+def move_song_to_track_number() -> Response:
+    """Move a song to a specific track number in the playlist.
+
+    Expected JSON Input:
+        - artist (str): The artist of the song.
+        - title (str): The title of the song.
+        - year (int): The year the song was released.
+        - track_number (int): The new track number to move the song to.
+
+    Returns:
+        Response: JSON response indicating success or an error message.
+
+    Raises:
+        400 error if required fields are missing.
+        500 error if an error occurs while updating the playlist.
+    """
+    data = request.get_json()
+
+    required_fields = ["artist", "title", "year", "track_number"]
+    missing_fields = [field for field in required_fields if field not in data]
+
+    if missing_fields:
+        current_app.logger.warning("Missing required fields: %s", missing_fields)
+        return json_response({
+            "status": "error",
+            "message": f"Missing required fields: {', '.join(missing_fields)}"
+        }, 400)
+
+    artist, title, year, track_number = data["artist"], data["title"], data["year"], data["track_number"]
+    current_app.logger.info("Received request to move song to track number %s: %s - %s (%s)", track_number, artist, title, year)
+
+    song = Songs.get_song_by_compound_key(artist, title, year)
+    playlist_model.move_song_to_track_number(song.id, track_number)
+
+    current_app.logger.info("Successfully moved song to track %s: %s - %s (%s)", track_number, artist, title, year)
+    return json_response({
+        "status": "success",
+        "message": f"Song '{title}' by {artist} moved to track {track_number}"
+    }, 200)
+
+
+@bp.route('/swap-songs-in-playlist', methods=['POST'])
+@login_required
+def swap_songs_in_playlist() -> Response:
+    """Swap two songs in the playlist by their track numbers.
+
+    Expected JSON Input:
+        - track_number_1 (int): The track number of the first song.
+        - track_number_2 (int): The track number of the second song.
+
+    Returns:
+        Response: JSON response indicating success or an error message.
+
+    Raises:
+        400 error if required fields are missing.
+        500 error if an error occurs while swapping songs in the playlist.
+    """
+    data = request.get_json()
+
+    required_fields = ["track_number_1", "track_number_2"]
+    missing_fields = [field for field in required_fields if field not in data]
+
+    if missing_fields:
+        current_app.logger.warning("Missing required fields: %s", missing_fields)
+        return json_response({
+            "status": "error",
+            "message": f"Missing required fields: {', '.join(missing_fields)}"
+        }, 400)
+
+    track_number_1, track_number_2 = data["track_number_1"], data["track_number_2"]
+    current_app.logger.info("Received request to swap songs at track numbers %s and %s", track_number_1, track_number_2)
+
+    song_1 = playlist_model.get_song_by_track_number(track_number_1)
+    song_2 = playlist_model.get_song_by_track_number(track_number_2)
+    playlist_model.swap_songs_in_playlist(song_1.id, song_2.id)
+
+    current_app.logger.info("Successfully swapped songs: %s - %s <-> %s - %s", song_1.artist, song_1.title, song_2.artist, song_2.title)
+    return json_response({
+        "status": "success",
+        "message": f"Swapped songs: {song_1.artist} - {song_1.title} <-> {song_2.artist} - {song_2.title}"
+    }, 200)
+
+
+############################################################
+#
+# Leaderboard / Stats
+#
+############################################################
+
+@bp.route('/song-leaderboard', methods=['GET'])
+def get_song_leaderboard() -> Response:
+    """
+    Route to retrieve a leaderboard of songs sorted by play count.
+
+    Returns:
+        JSON response with a sorted leaderboard of songs.
+
+    Raises:
+        500 error if there is an issue generating the leaderboard.
+
+    """
+    current_app.logger.info("Received request to generate song leaderboard")
+
+    leaderboard_data = Songs.get_all_songs(sort_by_play_count=True)
+
+    current_app.logger.info("Successfully generated song leaderboard with %s entries", len(leaderboard_data))
+    return json_response({
+        "status": "success",
+        "leaderboard": leaderboard_data
+    }, 200)
 
-    return app
 
 if __name__ == '__main__':
     app = create_app()
+    with app.app_context():
+        db.create_all()
     app.logger.info("Starting Flask app...")
     try:
-        app.run(debug=True, host='0.0.0.0', port=5000)
+        # Development server only; production is served by Gunicorn via wsgi.py
+        app.run(debug=os.getenv("FLASK_DEBUG", "false").lower() == "true", host='0.0.0.0', port=5000)
     except Exception as e:
-        app.logger.error(f"Flask app encountered an error: {e}")
+        app.logger.error("Flask app encountered an error: %s", e)
     finally:
         app.logger.info("Flask app has stopped.")
\ No newline at end of file
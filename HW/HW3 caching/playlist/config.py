@@ -9,12 +9,17 @@ class ProductionConfig():
     SESSION_COOKIE_NAME = 'session'
     SESSION_COOKIE_PATH = '/'
     SESSION_COOKIE_DOMAIN = None
+    SESSION_REFRESH_EACH_REQUEST = False  # Only send Set-Cookie when the session actually changes
+    REMEMBER_COOKIE_REFRESH_EACH_REQUEST = False
     SECRET_KEY = os.getenv("SECRET_KEY", "test-secret-key")  # Default secret key for testing
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', "sqlite:////app/db/app.db")  # Production database URI from environment
+    INIT_DB_ON_STARTUP = False  # Create tables with `flask --app app init-db` instead
+    SESSION_REDIS_URL = os.getenv("SESSION_REDIS_URL")  # Keep sessions in Redis instead of signed cookies when set
 
 class TestConfig():
     """Testing configuration."""
     TESTING = True
+    SECRET_KEY = "test-secret-key"  # Needed for logins in route tests
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'  # Use in-memory database for tests
@@ -3,6 +3,8 @@ import os
 import time
 from typing import List
 
+from cachetools import TTLCache
+
 from playlist.models.song_model import Songs
 from playlist.utils.api_utils import get_random
 from playlist.utils.logger import configure_logger
@@ -17,19 +19,26 @@ class PlaylistModel:
 
     """
 
+    __slots__ = ("current_track_number", "playlist", "_song_cache", "ttl_seconds")
+
     def __init__(self):
         """Initializes the PlaylistModel with an empty playlist and the current track set to 1.
 
         The playlist is a list of Songs, and the current track number is 1-indexed.
         The TTL (Time To Live) for song caching is set to a default value from the environment variable "TTL",
-        which defaults to 60 seconds if not set.
+        which defaults to 60 seconds if not set. At most SONG_CACHE_SIZE songs (default 1024) are cached.
 
         """
         self.current_track_number = 1
         self.playlist: List[int] = []
-        self._song_cache: dict[int, Songs] = {}
-        self._ttl: dict[int, float] = {}
         self.ttl_seconds = int(os.getenv("TTL", 60))  # Default TTL is 60 seconds
+        # Expiry deadlines are integer nanoseconds on the monotonic clock, which
+        # compare faster than floats and are immune to wall-clock adjustments
+        self._song_cache: TTLCache = TTLCache(
+            maxsize=int(os.getenv("SONG_CACHE_SIZE", 1024)),
+            ttl=self.ttl_seconds * 1_000_000_000,
+            timer=time.monotonic_ns
+        )
 
 
     ##################################################
@@ -52,23 +61,56 @@ class PlaylistModel:
         Raises:
             ValueError: If the song cannot be found in the database.
         """
-        now = time.time()
-
-        if song_id in self._song_cache and self._ttl.get(song_id, 0) > now:
-            logger.debug(f"Song ID {song_id} retrieved from cache")
-            return self._song_cache[song_id]
+        try:
+            song = self._song_cache[song_id]
+            logger.debug("Song ID %s retrieved from cache", song_id)
+            return song
+        except KeyError:
+            pass
 
         try:
             song = Songs.get_song_by_id(song_id)
-            logger.info(f"Song ID {song_id} loaded from DB")
+            logger.info("Song ID %s loaded from DB", song_id)
         except ValueError as e:
-            logger.error(f"Song ID {song_id} not found in DB: {e}")
+            logger.error("Song ID %s not found in DB: %s", song_id, e)
             raise ValueError(f"Song ID {song_id} not found in database") from e
 
         self._song_cache[song_id] = song
-        self._ttl[song_id] = now + self.ttl_seconds
         return song
 
+    def _prefetch_songs(self, song_ids: List[int]) -> None:
+        """
+        Loads every song in song_ids that is not validly cached with a single query.
+
+        Used before walking the whole playlist, so that a cold cache costs one
+        query instead of one per song. IDs missing from the database are left
+        uncached, so the per-song lookup still raises for them.
+
+        Args:
+            song_ids (List[int]): The IDs of the songs about to be retrieved.
+        """
+        missing = [song_id for song_id in set(song_ids) if song_id not in self._song_cache]
+        if not missing:
+            return
+
+        songs = Songs.get_songs_by_ids(missing)
+        logger.info("Loaded %s of %s uncached songs from DB", len(songs), len(missing))
+
+        for song in songs:
+            self._song_cache[song.id] = song
+
+    def warm_cache(self) -> None:
+        """
+        Loads every song in the playlist into the cache with a single query.
+
+        Called when a user logs in, so that the first playlist read of the
+        session is served from memory instead of one query per song.
+        """
+        if not self.playlist:
+            return
+        logger.info("Warming song cache for %s playlist entries", len(self.playlist))
+        self._prefetch_songs(self.playlist)
+
     def add_song_to_playlist(self, song_id: int) -> None:
         """
         Adds a song to the playlist by ID, using the cache or database lookup.
@@ -79,22 +121,22 @@ class PlaylistModel:
         Raises:
             ValueError: If the song ID is invalid or already exists in the playlist.
         """
-        logger.info(f"Received request to add song with ID {song_id} to the playlist")
+        logger.info("Received request to add song with ID %s to the playlist", song_id)
 
         song_id = self.validate_song_id(song_id, check_in_playlist=False)
 
         if song_id in self.playlist:
-            logger.error(f"Song with ID {song_id} already exists in the playlist")
+            logger.error("Song with ID %s already exists in the playlist", song_id)
             raise ValueError(f"Song with ID {song_id} already exists in the playlist")
 
         try:
             song = self._get_song_from_cache_or_db(song_id)
         except ValueError as e:
-            logger.error(f"Failed to add song: {e}")
+            logger.error("Failed to add song: %s", e)
             raise
 
         self.playlist.append(song.id)
-        logger.info(f"Successfully added to playlist: {song.artist} - {song.title} ({song.year})")
+        logger.info("Successfully added to playlist: %s - %s (%s)", song.artist, song.title, song.year)
 
 
     def remove_song_by_song_id(self, song_id: int) -> None:
@@ -107,17 +149,17 @@ class PlaylistModel:
             ValueError: If the playlist is empty or the song ID is invalid.
 
         """
-        logger.info(f"Received request to remove song with ID {song_id}")
+        logger.info("Received request to remove song with ID %s", song_id)
 
         self.check_if_empty()
         song_id = self.validate_song_id(song_id)
 
         if song_id not in self.playlist:
-            logger.warning(f"Song with ID {song_id} not found in the playlist")
+            logger.warning("Song with ID %s not found in the playlist", song_id)
             raise ValueError(f"Song with ID {song_id} not found in the playlist")
 
         self.playlist.remove(song_id)
-        logger.info(f"Successfully removed song with ID {song_id} from the playlist")
+        logger.info("Successfully removed song with ID %s from the playlist", song_id)
 
     def remove_song_by_track_number(self, track_number: int) -> None:
         """Removes a song from the playlist by its track number (1-indexed).
@@ -129,13 +171,13 @@ class PlaylistModel:
             ValueError: If the playlist is empty or the track number is invalid.
 
         """
-        logger.info(f"Received request to remove song at track number {track_number}")
+        logger.info("Received request to remove song at track number %s", track_number)
 
         self.check_if_empty()
         track_number = self.validate_track_number(track_number)
         playlist_index = track_number - 1
 
-        logger.info(f"Successfully removed song at track number {track_number}")
+        logger.info("Successfully removed song at track number %s", track_number)
         del self.playlist[playlist_index]
 
     def clear_playlist(self) -> None:
@@ -172,6 +214,7 @@ class PlaylistModel:
         """
         self.check_if_empty()
         logger.info("Retrieving all songs in the playlist")
+        self._prefetch_songs(self.playlist)
         return [self._get_song_from_cache_or_db(song_id) for song_id in self.playlist]
 
     def get_song_by_song_id(self, song_id: int) -> Songs:
@@ -188,9 +231,9 @@ class PlaylistModel:
         """
         self.check_if_empty()
         song_id = self.validate_song_id(song_id)
-        logger.info(f"Retrieving song with ID {song_id} from the playlist")
+        logger.info("Retrieving song with ID %s from the playlist", song_id)
         song = self._get_song_from_cache_or_db(song_id)
-        logger.info(f"Successfully retrieved song: {song.artist} - {song.title} ({song.year})")
+        logger.info("Successfully retrieved song: %s - %s (%s)", song.artist, song.title, song.year)
         return song
 
     def get_song_by_track_number(self, track_number: int) -> Songs:
@@ -209,10 +252,10 @@ class PlaylistModel:
         track_number = self.validate_track_number(track_number)
         playlist_index = track_number - 1
 
-        logger.info(f"Retrieving song at track number {track_number} from playlist")
+        logger.info("Retrieving song at track number %s from playlist", track_number)
         song_id = self.playlist[playlist_index]
         song = self._get_song_from_cache_or_db(song_id)
-        logger.info(f"Successfully retrieved song: {song.artist} - {song.title} ({song.year})")
+        logger.info("Successfully retrieved song: %s - %s (%s)", song.artist, song.title, song.year)
         return song
 
     def get_current_song(self) -> Songs:
@@ -236,7 +279,7 @@ class PlaylistModel:
 
         """
         length = len(self.playlist)
-        logger.info(f"Retrieving playlist length: {length} songs")
+        logger.info("Retrieving playlist length: %s songs", length)
         return length
 
     def get_playlist_duration(self) -> int:
@@ -246,8 +289,9 @@ class PlaylistModel:
         Returns:
             int: The total duration of all songs in the playlist in seconds.
         """
+        self._prefetch_songs(self.playlist)
         total_duration = sum(self._get_song_from_cache_or_db(song_id).duration for song_id in self.playlist)
-        logger.info(f"Retrieving total playlist duration: {total_duration} seconds")
+        logger.info("Retrieving total playlist duration: %s seconds", total_duration)
         return total_duration
 
 
@@ -268,7 +312,7 @@ class PlaylistModel:
         """
         self.check_if_empty()
         track_number = self.validate_track_number(track_number)
-        logger.info(f"Setting current track number to {track_number}")
+        logger.info("Setting current track number to %s", track_number)
         self.current_track_number = track_number
 
     def go_to_random_track(self) -> None:
@@ -283,7 +327,7 @@ class PlaylistModel:
         # Get a random index using the random.org API
         random_track = get_random(self.get_playlist_length())
 
-        logger.info(f"Setting current track number to random track: {random_track}")
+        logger.info("Setting current track number to random track: %s", random_track)
         self.current_track_number = random_track
 
     def move_song_to_beginning(self, song_id: int) -> None:
@@ -296,14 +340,14 @@ class PlaylistModel:
             ValueError: If the playlist is empty or the song ID is invalid.
 
         """
-        logger.info(f"Moving song with ID {song_id} to the beginning of the playlist")
+        logger.info("Moving song with ID %s to the beginning of the playlist", song_id)
         self.check_if_empty()
         song_id = self.validate_song_id(song_id)
 
         self.playlist.remove(song_id)
         self.playlist.insert(0, song_id)
 
-        logger.info(f"Successfully moved song with ID {song_id} to the beginning")
+        logger.info("Successfully moved song with ID %s to the beginning", song_id)
 
     def move_song_to_end(self, song_id: int) -> None:
         """Moves a song to the end of the playlist.
@@ -315,14 +359,14 @@ class PlaylistModel:
             ValueError: If the playlist is empty or the song ID is invalid.
 
         """
-        logger.info(f"Moving song with ID {song_id} to the end of the playlist")
+        logger.info("Moving song with ID %s to the end of the playlist", song_id)
         self.check_if_empty()
         song_id = self.validate_song_id(song_id)
 
         self.playlist.remove(song_id)
         self.playlist.append(song_id)
 
-        logger.info(f"Successfully moved song with ID {song_id} to the end")
+        logger.info("Successfully moved song with ID %s to the end", song_id)
 
     def move_song_to_track_number(self, song_id: int, track_number: int) -> None:
         """Moves a song to a specific track number in the playlist.
@@ -335,7 +379,7 @@ class PlaylistModel:
             ValueError: If the playlist is empty, the song ID is invalid, or the track number is out of range.
 
         """
-        logger.info(f"Moving song with ID {song_id} to track number {track_number}")
+        logger.info("Moving song with ID %s to track number %s", song_id, track_number)
         self.check_if_empty()
         song_id = self.validate_song_id(song_id)
         track_number = self.validate_track_number(track_number)
@@ -345,7 +389,7 @@ class PlaylistModel:
         self.playlist.remove(song_id)
         self.playlist.insert(playlist_index, song_id)
 
-        logger.info(f"Successfully moved song with ID {song_id} to track number {track_number}")
+        logger.info("Successfully moved song with ID %s to track number %s", song_id, track_number)
 
     def swap_songs_in_playlist(self, song1_id: int, song2_id: int) -> None:
         """Swaps the positions of two songs in the playlist.
@@ -358,20 +402,20 @@ class PlaylistModel:
             ValueError: If the playlist is empty, either song ID is invalid, or attempting to swap the same song.
 
         """
-        logger.info(f"Swapping songs with IDs {song1_id} and {song2_id}")
+        logger.info("Swapping songs with IDs %s and %s", song1_id, song2_id)
         self.check_if_empty()
         song1_id = self.validate_song_id(song1_id)
         song2_id = self.validate_song_id(song2_id)
 
         if song1_id == song2_id:
-            logger.error(f"Cannot swap a song with itself: {song1_id}")
+            logger.error("Cannot swap a song with itself: %s", song1_id)
             raise ValueError(f"Cannot swap a song with itself: {song1_id}")
 
         index1, index2 = self.playlist.index(song1_id), self.playlist.index(song2_id)
 
         self.playlist[index1], self.playlist[index2] = self.playlist[index2], self.playlist[index1]
 
-        logger.info(f"Successfully swapped songs with IDs {song1_id} and {song2_id}")
+        logger.info("Successfully swapped songs with IDs %s and %s", song1_id, song2_id)
 
 
     ##################################################
@@ -389,12 +433,12 @@ class PlaylistModel:
         self.check_if_empty()
         current_song = self.get_song_by_track_number(self.current_track_number)
 
-        logger.info(f"Playing song: {current_song.title} (ID: {current_song.id}) at track number: {self.current_track_number}")
+        logger.info("Playing song: %s (ID: %s) at track number: %s", current_song.title, current_song.id, self.current_track_number)
         current_song.update_play_count()
-        logger.info(f"Updated play count for song: {current_song.title} (ID: {current_song.id})")
+        logger.info("Updated play count for song: %s (ID: %s)", current_song.title, current_song.id)
 
         self.current_track_number = (self.current_track_number % self.get_playlist_length()) + 1
-        logger.info(f"Advanced to track number: {self.current_track_number}")
+        logger.info("Advanced to track number: %s", self.current_track_number)
 
     def play_entire_playlist(self) -> None:
         """Plays all songs in the playlist from the beginning.
@@ -407,6 +451,7 @@ class PlaylistModel:
         logger.info("Starting to play the entire playlist.")
 
         self.current_track_number = 1
+        self._prefetch_songs(self.playlist)
         for _ in range(self.get_playlist_length()):
             self.play_current_song()
 
@@ -420,8 +465,9 @@ class PlaylistModel:
 
         """
         self.check_if_empty()
-        logger.info(f"Playing the rest of the playlist from track number: {self.current_track_number}")
+        logger.info("Playing the rest of the playlist from track number: %s", self.current_track_number)
 
+        self._prefetch_songs(self.playlist[self.current_track_number - 1:])
         for _ in range(self.get_playlist_length() - self.current_track_number + 1):
             self.play_current_song()
 
@@ -473,17 +519,17 @@ class PlaylistModel:
             if song_id < 0:
                 raise ValueError
         except ValueError:
-            logger.error(f"Invalid song id: {song_id}")
+            logger.error("Invalid song id: %s", song_id)
             raise ValueError(f"Invalid song id: {song_id}")
 
         if check_in_playlist and song_id not in self.playlist:
-            logger.error(f"Song with id {song_id} not found in playlist")
+            logger.error("Song with id %s not found in playlist", song_id)
             raise ValueError(f"Song with id {song_id} not found in playlist")
 
         try:
             self._get_song_from_cache_or_db(song_id)
         except Exception as e:
-            logger.error(f"Song with id {song_id} not found in database: {e}")
+            logger.error("Song with id %s not found in database: %s", song_id, e)
             raise ValueError(f"Song with id {song_id} not found in database")
 
         return song_id
@@ -507,7 +553,7 @@ class PlaylistModel:
             if not (1 <= track_number <= self.get_playlist_length()):
                 raise ValueError(f"Invalid track number: {track_number}")
         except ValueError as e:
-            logger.error(f"Invalid track number: {track_number}")
+            logger.error("Invalid track number: %s", track_number)
             raise ValueError(f"Invalid track number: {track_number}") from e
 
         return track_number
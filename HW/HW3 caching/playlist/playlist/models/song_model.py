@@ -1,5 +1,7 @@
 import logging
+from typing import List
 
+from sqlalchemy import delete, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from playlist.db import db
@@ -22,6 +24,10 @@ class Songs(db.Model):
     """
 
     __tablename__ = "Songs"
+    __table_args__ = (
+        # Backs the compound-key lookups and rejects duplicate songs at the database level
+        db.Index("ix_songs_artist_title_year", "artist", "title", "year", unique=True),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     artist = db.Column(db.String, nullable=False)
@@ -64,7 +70,7 @@ class Songs(db.Model):
             ValueError: If any field is invalid or if a song with the same compound key already exists.
             SQLAlchemyError: For any other database-related issues.
         """
-        logger.info(f"Received request to create song: {artist} - {title} ({year})")
+        logger.info("Received request to create song: %s - %s (%s)", artist, title, year)
 
         try:
             song = Songs(
@@ -76,27 +82,22 @@ class Songs(db.Model):
             )
             song.validate()
         except ValueError as e:
-            logger.warning(f"Validation failed: {e}")
+            logger.warning("Validation failed: %s", e)
             raise
 
         try:
-            # Check for existing song with same compound key (artist, title, year)
-            existing = Songs.query.filter_by(artist=artist.strip(), title=title.strip(), year=year).first()
-            if existing:
-                logger.error(f"Song already exists: {artist} - {title} ({year})")
-                raise ValueError(f"Song with artist '{artist}', title '{title}', and year {year} already exists.")
-
+            # A duplicate compound key (artist, title, year) is rejected by the unique index
             db.session.add(song)
             db.session.commit()
-            logger.info(f"Song successfully added: {artist} - {title} ({year})")
+            logger.info("Song successfully added: %s - %s (%s)", artist, title, year)
 
         except IntegrityError:
-            logger.error(f"Song already exists: {artist} - {title} ({year})")
+            logger.error("Song already exists: %s - %s (%s)", artist, title, year)
             db.session.rollback()
             raise ValueError(f"Song with artist '{artist}', title '{title}', and year {year} already exists.")
 
         except SQLAlchemyError as e:
-            logger.error(f"Database error while creating song: {e}")
+            logger.error("Database error while creating song: %s", e)
             db.session.rollback()
             raise
 
@@ -112,23 +113,50 @@ class Songs(db.Model):
             ValueError: If the song with the given ID does not exist.
             SQLAlchemyError: For any database-related issues.
         """
-        logger.info(f"Received request to delete song with ID {song_id}")
+        logger.info("Received request to delete song with ID %s", song_id)
 
         try:
-            song = cls.query.get(song_id)
-            if not song:
-                logger.warning(f"Attempted to delete non-existent song with ID {song_id}")
+            # Check for existence and delete in a single round-trip
+            deleted = db.session.execute(delete(cls).where(cls.id == song_id).returning(cls.id)).first()
+            if deleted is None:
+                db.session.rollback()
+                logger.warning("Attempted to delete non-existent song with ID %s", song_id)
                 raise ValueError(f"Song with ID {song_id} not found")
 
-            db.session.delete(song)
             db.session.commit()
-            logger.info(f"Successfully deleted song with ID {song_id}")
+            logger.info("Successfully deleted song with ID %s", song_id)
 
         except SQLAlchemyError as e:
-            logger.error(f"Database error while deleting song with ID {song_id}: {e}")
+            logger.error("Database error while deleting song with ID %s: %s", song_id, e)
             db.session.rollback()
             raise
 
+    @classmethod
+    def get_songs_by_ids(cls, song_ids: List[int]) -> List["Songs"]:
+        """
+        Retrieves several songs from the catalog with a single query.
+
+        IDs that do not match a song are skipped rather than raising, so callers
+        can tell which ones are missing.
+
+        Args:
+            song_ids (List[int]): The IDs of the songs to retrieve.
+
+        Returns:
+            List[Songs]: The songs found, in no particular order.
+
+        Raises:
+            SQLAlchemyError: If a database error occurs.
+        """
+        logger.info("Attempting to retrieve %s songs by ID", len(song_ids))
+
+        try:
+            return db.session.execute(select(cls).where(cls.id.in_(song_ids))).scalars().all()
+
+        except SQLAlchemyError as e:
+            logger.error("Database error while retrieving songs by ID: %s", e)
+            raise
+
     @classmethod
     def get_song_by_id(cls, song_id: int) -> "Songs":
         """
@@ -144,20 +172,20 @@ class Songs(db.Model):
             ValueError: If no song with the given ID is found.
             SQLAlchemyError: If a database error occurs.
         """
-        logger.info(f"Attempting to retrieve song with ID {song_id}")
+        logger.info("Attempting to retrieve song with ID %s", song_id)
 
         try:
-            song = cls.query.get(song_id)
+            song = db.session.get(cls, song_id)
 
             if not song:
-                logger.info(f"Song with ID {song_id} not found")
+                logger.info("Song with ID %s not found", song_id)
                 raise ValueError(f"Song with ID {song_id} not found")
 
-            logger.info(f"Successfully retrieved song: {song.artist} - {song.title} ({song.year})")
+            logger.info("Successfully retrieved song: %s - %s (%s)", song.artist, song.title, song.year)
             return song
 
         except SQLAlchemyError as e:
-            logger.error(f"Database error while retrieving song by ID {song_id}: {e}")
+            logger.error("Database error while retrieving song by ID %s: %s", song_id, e)
             raise
 
     @classmethod
@@ -177,22 +205,22 @@ class Songs(db.Model):
             ValueError: If no matching song is found.
             SQLAlchemyError: If a database error occurs.
         """
-        logger.info(f"Attempting to retrieve song with artist '{artist}', title '{title}', and year {year}")
+        logger.info("Attempting to retrieve song with artist '%s', title '%s', and year %s", artist, title, year)
 
         try:
             song = cls.query.filter_by(artist=artist.strip(), title=title.strip(), year=year).first()
 
             if not song:
-                logger.info(f"Song with artist '{artist}', title '{title}', and year {year} not found")
+                logger.info("Song with artist '%s', title '%s', and year %s not found", artist, title, year)
                 raise ValueError(f"Song with artist '{artist}', title '{title}', and year {year} not found")
 
-            logger.info(f"Successfully retrieved song: {song.artist} - {song.title} ({song.year})")
+            logger.info("Successfully retrieved song: %s - %s (%s)", song.artist, song.title, song.year)
             return song
 
         except SQLAlchemyError as e:
             logger.error(
-                f"Database error while retrieving song by compound key "
-                f"(artist '{artist}', title '{title}', year {year}): {e}"
+                "Database error while retrieving song by compound key (artist '%s', title '%s', year %s): %s",
+                artist, title, year, e
             )
             raise
 
@@ -213,34 +241,23 @@ class Songs(db.Model):
         logger.info("Attempting to retrieve all songs from the catalog")
 
         try:
-            query = cls.query
+            # Select plain columns, so rows come back as mappings without building
+            # (and identity-mapping) a Songs object per row
+            stmt = select(cls.id, cls.artist, cls.title, cls.year, cls.genre, cls.duration, cls.play_count)
             if sort_by_play_count:
-                query = query.order_by(cls.play_count.desc())
+                stmt = stmt.order_by(cls.play_count.desc())
 
-            songs = query.all()
+            results = [dict(row) for row in db.session.execute(stmt).mappings()]
 
-            if not songs:
+            if not results:
                 logger.warning("The song catalog is empty.")
                 return []
 
-            results = [
-                {
-                    "id": song.id,
-                    "artist": song.artist,
-                    "title": song.title,
-                    "year": song.year,
-                    "genre": song.genre,
-                    "duration": song.duration,
-                    "play_count": song.play_count,
-                }
-                for song in songs
-            ]
-
-            logger.info(f"Retrieved {len(results)} songs from the catalog")
+            logger.info("Retrieved %s songs from the catalog", len(results))
             return results
 
         except SQLAlchemyError as e:
-            logger.error(f"Database error while retrieving all songs: {e}")
+            logger.error("Database error while retrieving all songs: %s", e)
             raise
 
     @classmethod
@@ -258,7 +275,7 @@ class Songs(db.Model):
             raise ValueError("The song catalog is empty.")
 
         index = get_random(len(all_songs))
-        logger.info(f"Random index selected: {index} (total songs: {len(all_songs)})")
+        logger.info("Random index selected: %s (total songs: %s)", index, len(all_songs))
 
         return all_songs[index - 1]
 
@@ -271,20 +288,20 @@ class Songs(db.Model):
             SQLAlchemyError: If any database error occurs.
         """
 
-        logger.info(f"Attempting to update play count for song with ID {self.id}")
+        logger.info("Attempting to update play count for song with ID %s", self.id)
 
         try:
-            song = Songs.query.get(self.id)
+            song = db.session.get(Songs, self.id)
             if not song:
-                logger.warning(f"Cannot update play count: Song with ID {self.id} not found.")
+                logger.warning("Cannot update play count: Song with ID %s not found.", self.id)
                 raise ValueError(f"Song with ID {self.id} not found")
 
             song.play_count += 1
             db.session.commit()
 
-            logger.info(f"Play count incremented for song with ID: {self.id}")
+            logger.info("Play count incremented for song with ID: %s", self.id)
 
         except SQLAlchemyError as e:
-            logger.error(f"Database error while updating play count for song with ID {self.id}: {e}")
+            logger.error("Database error while updating play count for song with ID %s: %s", self.id, e)
             db.session.rollback()
             raise
@@ -1,8 +1,15 @@
 import hashlib
+import hmac
 import logging
 import os
+from typing import Optional
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from flask_login import UserMixin
+import gevent
+from gevent import monkey
+from sqlalchemy import lambda_stmt, select, update
 from sqlalchemy.exc import IntegrityError
 
 from playlist.db import db
@@ -12,29 +19,83 @@ from playlist.utils.logger import configure_logger
 logger = logging.getLogger(__name__)
 configure_logger(logger)
 
+# Argon2id, defaulting to the OWASP-recommended parameters: 3 passes over 64 MiB
+# with 2 lanes. Deployments can tune the cost to their hardware; hashes made with
+# other parameters are upgraded on the user's next successful login.
+password_hasher = PasswordHasher(
+    time_cost=int(os.getenv("ARGON2_TIME_COST", 3)),
+    memory_cost=int(os.getenv("ARGON2_MEMORY_COST", 65536)),  # KiB
+    parallelism=int(os.getenv("ARGON2_PARALLELISM", 2))
+)
+
+# Verified against when a login names an unknown user, so that the response takes
+# as long as a wrong password would and does not reveal whether the account exists
+_DUMMY_HASH = password_hasher.hash("not-a-real-password")
+
+
+def _run_in_native_thread(func, *args):
+    """
+    Run a CPU-bound call without blocking the gevent event loop.
+
+    Under gevent workers every greenlet in the process shares one OS thread, so
+    a ~50 ms Argon2 call would stall all other in-flight requests. argon2-cffi
+    releases the GIL while hashing, so it is handed to gevent's pool of real
+    threads instead. Without monkey-patching the call simply runs inline.
+
+    Args:
+        func (callable): The function to call.
+        *args: Positional arguments for the function.
+
+    Returns:
+        The return value of the function.
+    """
+    if monkey.is_module_patched("threading"):
+        return gevent.get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+
+def _verify_password(password_hash: str, password: str) -> bool:
+    """
+    Check a password against an Argon2 hash.
+
+    Mismatches are returned rather than raised, since gevent's thread pool
+    prints a traceback for every exception raised in a worker.
+
+    Args:
+        password_hash (str): The stored Argon2 hash.
+        password (str): The password to check.
+
+    Returns:
+        bool: True if the password matches the hash, False otherwise.
+    """
+    try:
+        return password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
 
 class Users(db.Model, UserMixin):
     __tablename__ = 'users'
 
     id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)
-    salt = db.Column(db.String(32), nullable=False)  # 16-byte salt in hex
-    password = db.Column(db.String(64), nullable=False)  # SHA-256 hash in hex
+    username = db.Column(db.String(80), unique=True, index=True, nullable=False)
+    salt = db.Column(db.String(32), nullable=True)  # Only set for legacy SHA-256 hashes
+    password = db.Column(db.String(128), nullable=False)  # Argon2id hash in PHC string format
 
     @staticmethod
-    def _generate_hashed_password(password: str) -> tuple[str, str]:
+    def _generate_hashed_password(password: str) -> str:
         """
         Generates a salted, hashed password.
 
+        The salt is generated by Argon2 and stored as part of the returned hash.
+
         Args:
             password (str): The password to hash.
 
         Returns:
-            tuple: A tuple containing the salt and hashed password.
+            str: The Argon2id hash of the password.
         """
-        salt = os.urandom(16).hex()
-        hashed_password = hashlib.sha256((password + salt).encode()).hexdigest()
-        return salt, hashed_password
+        return _run_in_native_thread(password_hasher.hash, password)
 
     @classmethod
     def create_user(cls, username: str, password: str) -> None:
@@ -48,8 +109,8 @@ class Users(db.Model, UserMixin):
         Raises:
             ValueError: If a user with the username already exists.
         """
-        salt, hashed_password = cls._generate_hashed_password(password)
-        new_user = cls(username=username, salt=salt, password=hashed_password)
+        hashed_password = cls._generate_hashed_password(password)
+        new_user = cls(username=username, password=hashed_password)
         try:
             db.session.add(new_user)
             db.session.commit()
@@ -64,26 +125,78 @@ class Users(db.Model, UserMixin):
             raise
 
     @classmethod
-    def check_password(cls, username: str, password: str) -> bool:
+    def get_by_username(cls, username: str) -> Optional["Users"]:
         """
-        Check if a given password matches the stored password for a user.
+        Look up a user by username.
+
+        The statement is a lambda_stmt, so SQLAlchemy builds and caches it once
+        and only binds the username on later calls.
+
+        Args:
+            username (str): The username of the user.
+
+        Returns:
+            Users | None: The user, or None if no such user exists.
+        """
+        stmt = lambda_stmt(lambda: select(Users).where(Users.username == username))
+        return db.session.execute(stmt).scalar_one_or_none()
+
+    @classmethod
+    def authenticate(cls, username: str, password: str) -> Optional["Users"]:
+        """
+        Look up a user and check their password with a single query.
+
+        Legacy salted SHA-256 hashes, and Argon2 hashes made with outdated
+        parameters, are rehashed with the current parameters on a successful check.
 
         Args:
             username (str): The username of the user.
             password (str): The password to check.
 
         Returns:
-            bool: True if the password is correct, False otherwise.
+            Users | None: The user if the password is correct, None otherwise.
 
         Raises:
             ValueError: If the user does not exist.
         """
-        user = cls.query.filter_by(username=username).first()
+        user = cls.get_by_username(username)
         if not user:
+            _run_in_native_thread(_verify_password, _DUMMY_HASH, password)
             logger.info("User %s not found", username)
             raise ValueError(f"User {username} not found")
-        hashed_password = hashlib.sha256((password + user.salt).encode()).hexdigest()
-        return hashed_password == user.password
+
+        if user.salt:
+            hashed_password = hashlib.sha256((password + user.salt).encode()).hexdigest()
+            if not hmac.compare_digest(hashed_password, user.password):
+                return None
+        else:
+            if not _run_in_native_thread(_verify_password, user.password, password):
+                return None
+
+        if user.salt or password_hasher.check_needs_rehash(user.password):
+            logger.info("Rehashing password for user: %s", username)
+            user.salt = None
+            user.password = cls._generate_hashed_password(password)
+            db.session.commit()
+
+        return user
+
+    @classmethod
+    def check_password(cls, username: str, password: str) -> bool:
+        """
+        Check if a given password matches the stored password for a user.
+
+        Args:
+            username (str): The username of the user.
+            password (str): The password to check.
+
+        Returns:
+            bool: True if the password is correct, False otherwise.
+
+        Raises:
+            ValueError: If the user does not exist.
+        """
+        return cls.authenticate(username, password) is not None
 
     @classmethod
     def delete_user(cls, username: str) -> None:
@@ -96,7 +209,7 @@ class Users(db.Model, UserMixin):
         Raises:
             ValueError: If the user does not exist.
         """
-        user = cls.query.filter_by(username=username).first()
+        user = cls.get_by_username(username)
         if not user:
             logger.info("User %s not found", username)
             raise ValueError(f"User {username} not found")
@@ -127,7 +240,7 @@ class Users(db.Model, UserMixin):
         Raises:
             ValueError: If the user does not exist.
         """
-        user = cls.query.filter_by(username=username).first()
+        user = cls.get_by_username(username)
         if not user:
             logger.info("User %s not found", username)
             raise ValueError(f"User {username} not found")
@@ -145,13 +258,37 @@ class Users(db.Model, UserMixin):
         Raises:
             ValueError: If the user does not exist.
         """
-        user = cls.query.filter_by(username=username).first()
+        user = cls.get_by_username(username)
         if not user:
             logger.info("User %s not found", username)
             raise ValueError(f"User {username} not found")
 
-        salt, hashed_password = cls._generate_hashed_password(new_password)
-        user.salt = salt
-        user.password = hashed_password
+        cls.update_password_by_id(user.id, new_password)
+
+    @classmethod
+    def update_password_by_id(cls, user_id: int, new_password: str) -> None:
+        """
+        Update the password for a user whose ID is already known.
+
+        The change is issued as a single UPDATE statement, so no Users instance
+        is loaded or attached to the session. Callers holding a cached, detached
+        user (such as current_user) can pass its ID without touching the instance.
+
+        Args:
+            user_id (int): The ID of the user.
+            new_password (str): The new password to set.
+
+        Raises:
+            ValueError: If the user does not exist.
+        """
+        hashed_password = cls._generate_hashed_password(new_password)
+        result = db.session.execute(
+            update(cls).where(cls.id == user_id).values(password=hashed_password, salt=None)
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
+            logger.info("User with ID %s not found", user_id)
+            raise ValueError(f"User with ID {user_id} not found")
+
         db.session.commit()
-        logger.info("Password updated successfully for user: %s", username)
\ No newline at end of file
+        logger.info("Password updated successfully for user ID: %s", user_id)
@@ -1,6 +1,8 @@
 import logging
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from playlist.utils.logger import configure_logger
 
@@ -8,6 +10,15 @@ from playlist.utils.logger import configure_logger
 RANDOM_ORG_BASE_URL = os.getenv("RANDOM_ORG_BASE_URL",
                                 "https://www.random.org/integers/?num=1&min=1&col=1&base=10&format=plain&rnd=new")
 
+# A shared session keeps connections to random.org alive between calls, so each
+# request does not pay for a new TCP and TLS handshake.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+))
+
 
 logger = logging.getLogger(__name__)
 configure_logger(logger)
@@ -35,20 +46,21 @@ def get_random(max: int) -> int:
 
     try:
         # Log the request to random.org
-        logger.info(f"Fetching random number from {url}")
+        logger.info("Fetching random number from %s", url)
 
-        response = requests.get(url, timeout=5)
+        response = SESSION.get(url, timeout=5)
         response.raise_for_status()
 
-        random_number_str = response.text.strip()
-
+        # Parse the raw body; int() accepts ASCII bytes, so the body never has
+        # to be decoded to text (which may also run charset detection)
         try:
-            random_number = int(random_number_str)
+            random_number = int(response.content)
         except ValueError:
-            logger.error(f"Invalid response from random.org: {random_number_str}")
+            random_number_str = response.content.decode(errors="replace").strip()
+            logger.error("Invalid response from random.org: %s", random_number_str)
             raise ValueError(f"Invalid response from random.org: {random_number_str}")
 
-        logger.info(f"Received random number: {random_number}")
+        logger.info("Received random number: %s", random_number)
         return random_number
 
     except requests.exceptions.Timeout:
@@ -56,5 +68,5 @@ def get_random(max: int) -> int:
         raise RuntimeError("Request to random.org timed out.")
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request to random.org failed: {e}")
+        logger.error("Request to random.org failed: %s", e)
         raise RuntimeError(f"Request to random.org failed: {e}")
@@ -2,13 +2,26 @@ import logging
 import sys
 
 from flask import current_app, has_request_context
+from flask.logging import default_handler
+
+
+HANDLER_NAME = "console"
 
 
 def configure_logger(logger):
     logger.setLevel(logging.DEBUG)  # Set the desired logging level here
 
+    # Flask's own handler on app.logger would print every record a second time
+    logger.removeHandler(default_handler)
+
+    # Loggers are process-wide, so configuring one again (create_app runs once per
+    # app, modules may be re-imported) must not stack up another console handler
+    if any(handler.get_name() == HANDLER_NAME for handler in logger.handlers):
+        return
+
     # Create a console handler that logs to stderr
     handler = logging.StreamHandler(sys.stderr)
+    handler.set_name(HANDLER_NAME)
     handler.setLevel(logging.DEBUG)
 
     # Create a formatter with a timestamp
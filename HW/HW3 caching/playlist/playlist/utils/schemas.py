@@ -0,0 +1,49 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class Credentials(BaseModel):
+    """Request body for the create-user and login routes.
+
+    Attributes:
+        username (str): The username of the user.
+        password (str): The password of the user.
+
+    """
+    model_config = ConfigDict(strict=True)
+
+    username: str = Field(min_length=1)
+    password: str = Field(min_length=1)
+
+
+class NewPassword(BaseModel):
+    """Request body for the change-password route.
+
+    Attributes:
+        new_password (str): The new password to set.
+
+    """
+    model_config = ConfigDict(strict=True)
+
+    new_password: str = Field(min_length=1)
+
+
+class SongIn(BaseModel):
+    """Request body for the create-song route.
+
+    Strict mode mirrors the route's original isinstance checks.
+
+    Attributes:
+        artist (str): The artist's name.
+        title (str): The song title.
+        year (int): The year the song was released.
+        genre (str): The genre of the song.
+        duration (int): The duration of the song in seconds.
+
+    """
+    model_config = ConfigDict(strict=True)
+
+    artist: str
+    title: str
+    year: int
+    genre: str
+    duration: int
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
 
@@ -23,16 +25,23 @@ def run_smoketest():
         "duration": 301
     }
 
-    health_response = requests.get(f"{base_url}/health")
+    # The health check and both resets are independent, so issue them
+    # concurrently; everything after this depends on their outcome.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        health_future = pool.submit(requests.get, f"{base_url}/health")
+        delete_user_future = pool.submit(requests.delete, f"{base_url}/reset-users")
+        delete_song_future = pool.submit(requests.delete, f"{base_url}/reset-songs")
+
+    health_response = health_future.result()
     assert health_response.status_code == 200
     assert health_response.json()["status"] == "success"
 
-    delete_user_response = requests.delete(f"{base_url}/reset-users")
+    delete_user_response = delete_user_future.result()
     assert delete_user_response.status_code == 200
     assert delete_user_response.json()["status"] == "success"
     print("Reset users successful")
 
-    delete_song_response = requests.delete(f"{base_url}/reset-songs")
+    delete_song_response = delete_song_future.result()
     assert delete_song_response.status_code == 200
     assert delete_song_response.json()["status"] == "success"
     print("Reset song successful")
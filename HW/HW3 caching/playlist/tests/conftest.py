@@ -1,15 +1,39 @@
+import os
+
 import pytest
 
+# Production Argon2 parameters cost ~100ms per hash; the tests only need the
+# hashing behaviour, so use the cheapest settings unless overridden. These are
+# read when the user model is imported, so set them before importing the app.
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST", "8")
+os.environ.setdefault("ARGON2_PARALLELISM", "1")
+
 from app import create_app
 from config import TestConfig
 from playlist.db import db
+from playlist.models.playlist_model import PlaylistModel
+
+@pytest.fixture(scope="session")
+def _app():
+    # Building the app is the same for every test, so do it once; the app
+    # fixture below gives each test fresh tables and fresh in-process state
+    return create_app(TestConfig)
 
 @pytest.fixture
-def app():
-    app = create_app(TestConfig)
-    with app.app_context():
+def app(_app):
+    # The app object is shared, so reset everything it keeps in process memory:
+    # the playlist (which owns the song cache) and the user cache
+    _app.extensions["playlist_model"] = PlaylistModel()
+    _app.extensions["user_cache"].clear()
+    with _app.app_context():
         db.create_all()
-        yield app
+    # No app context is held while the test runs: Flask reuses an already pushed
+    # context for test client requests, which would carry per-request state such
+    # as flask_login's current user (kept on g) from one request to the next.
+    # Tests that use the database directly get a context from the session fixture.
+    yield _app
+    with _app.app_context():
         db.session.remove()
         db.drop_all()
 
@@ -0,0 +1,140 @@
+import pytest
+from sqlalchemy import event
+
+from playlist.db import db
+
+
+SONG = {
+    "artist": "The Beatles",
+    "title": "Hey Jude",
+    "year": 1968,
+    "genre": "Rock",
+    "duration": 431
+}
+
+
+# --- Fixtures ---
+
+@pytest.fixture
+def logged_in_client(client):
+    """Fixture for a test client logged in as a freshly created user."""
+    client.put("/api/create-user", json={"username": "testuser", "password": "password123"})
+    response = client.post("/api/login", json={"username": "testuser", "password": "password123"})
+    assert response.status_code == 200
+    return client
+
+
+@pytest.fixture
+def user_cache(app):
+    """Fixture for the app's cache of logged-in users."""
+    return app.extensions["user_cache"]
+
+
+@pytest.fixture
+def count_queries(app):
+    """Fixture that returns a list collecting every SQL statement the app executes."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+# --- Error Handling ---
+
+def test_create_duplicate_song_returns_400(logged_in_client):
+    """Test that a duplicate song is rejected with a 400, not a 500."""
+    assert logged_in_client.post("/api/create-song", json=SONG).status_code == 201
+
+    response = logged_in_client.post("/api/create-song", json=SONG)
+
+    assert response.status_code == 400
+    assert response.get_json() == {
+        "status": "error",
+        "message": "Song with artist 'The Beatles', title 'Hey Jude', and year 1968 already exists."
+    }
+
+
+def test_create_song_invalid_year_returns_400(logged_in_client):
+    """Test that a song failing model validation is rejected with a 400."""
+    response = logged_in_client.post("/api/create-song", json={**SONG, "year": 1800})
+
+    assert response.status_code == 400
+    assert response.get_json()["status"] == "error"
+    assert "details" not in response.get_json()
+
+
+def test_get_song_by_compound_key_not_found_returns_400(logged_in_client):
+    """Test that looking up a missing song by compound key is a 400."""
+    response = logged_in_client.get(
+        "/api/get-song-from-catalog-by-compound-key",
+        query_string={"artist": "Nobody", "title": "Nothing", "year": 2000}
+    )
+
+    assert response.status_code == 400
+    assert response.get_json() == {
+        "status": "error",
+        "message": "Song with artist 'Nobody', title 'Nothing', and year 2000 not found"
+    }
+
+
+def test_unexpected_error_returns_generic_500(logged_in_client, mocker):
+    """Test that unexpected errors become a 500 without leaking their message."""
+    mocker.patch("app.Songs.get_all_songs", side_effect=RuntimeError("secret internals"))
+
+    response = logged_in_client.get("/api/get-all-songs-from-catalog")
+
+    assert response.status_code == 500
+    assert response.get_json() == {"status": "error", "message": "An internal error occurred"}
+
+
+# --- User Cache ---
+
+def test_user_cache_hit_skips_database(logged_in_client, user_cache, count_queries):
+    """Test that once cached, the logged-in user is resolved without querying the database."""
+    assert logged_in_client.get("/api/get-playlist-length-duration").status_code == 200
+    assert "testuser" in user_cache
+
+    count_queries.clear()
+    assert logged_in_client.get("/api/get-playlist-length-duration").status_code == 200
+
+    assert count_queries == []
+
+
+def test_change_password_invalidates_cached_user(logged_in_client, user_cache):
+    """Test that changing the password drops the cached user and takes effect."""
+    logged_in_client.get("/api/get-playlist-length-duration")
+    assert "testuser" in user_cache
+
+    response = logged_in_client.post("/api/change-password", json={"new_password": "newpassword456"})
+
+    assert response.status_code == 200
+    assert "testuser" not in user_cache
+    assert logged_in_client.post("/api/login", json={"username": "testuser", "password": "password123"}).status_code == 401
+    assert logged_in_client.post("/api/login", json={"username": "testuser", "password": "newpassword456"}).status_code == 200
+
+
+def test_reset_users_clears_user_cache(logged_in_client, user_cache):
+    """Test that recreating the Users table empties the user cache."""
+    logged_in_client.get("/api/get-playlist-length-duration")
+    assert "testuser" in user_cache
+
+    assert logged_in_client.delete("/api/reset-users").status_code == 200
+
+    assert len(user_cache) == 0
+    assert logged_in_client.get("/api/get-playlist-length-duration").status_code == 401
+
+
+def test_logout_invalidates_cached_user(logged_in_client, user_cache):
+    """Test that logging out drops the user from the cache."""
+    logged_in_client.get("/api/get-playlist-length-duration")
+    assert "testuser" in user_cache
+
+    assert logged_in_client.post("/api/logout").status_code == 200
+
+    assert "testuser" not in user_cache
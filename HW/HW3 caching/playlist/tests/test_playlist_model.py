@@ -181,6 +181,34 @@ def test_get_all_songs(playlist_model, sample_playlist, mocker):
     assert all_songs[1].id == 2
 
 
+def test_get_all_songs_loads_uncached_songs_in_one_query(playlist_model, sample_playlist, mocker):
+    """Test that a cold cache is filled with a single batch query."""
+    mock_get_song_by_id = mocker.patch("playlist.models.playlist_model.Songs.get_song_by_id")
+    mock_get_songs_by_ids = mocker.patch("playlist.models.playlist_model.Songs.get_songs_by_ids", return_value=sample_playlist)
+
+    playlist_model.playlist.extend([1, 2])
+
+    all_songs = playlist_model.get_all_songs()
+
+    assert [song.id for song in all_songs] == [1, 2]
+    mock_get_songs_by_ids.assert_called_once()
+    mock_get_song_by_id.assert_not_called()
+
+
+def test_warm_cache_loads_playlist_in_one_query(playlist_model, sample_playlist, mocker):
+    """Test that warming the cache loads the whole playlist with a single batch query."""
+    mock_get_song_by_id = mocker.patch("playlist.models.playlist_model.Songs.get_song_by_id")
+    mock_get_songs_by_ids = mocker.patch("playlist.models.playlist_model.Songs.get_songs_by_ids", return_value=sample_playlist)
+
+    playlist_model.playlist.extend([1, 2])
+
+    playlist_model.warm_cache()
+    playlist_model.get_all_songs()
+
+    mock_get_songs_by_ids.assert_called_once()
+    mock_get_song_by_id.assert_not_called()
+
+
 def test_get_song_by_song_id(playlist_model, song_beatles, mocker):
     """Test successfully retrieving a song from the playlist by song ID."""
     mocker.patch("playlist.models.playlist_model.Songs.get_song_by_id", return_value=song_beatles)
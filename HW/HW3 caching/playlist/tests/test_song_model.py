@@ -58,18 +58,23 @@ def test_get_song_by_id(song_beatles):
     fetched = Songs.get_song_by_id(song_beatles.id)
     assert fetched.title == "Hey Jude"
 
-def test_get_song_by_id_not_found(app):
+def test_get_song_by_id_not_found(session):
     """Test error when fetching nonexistent song by ID."""
     with pytest.raises(ValueError, match="not found"):
         Songs.get_song_by_id(999)
 
+def test_get_songs_by_ids(song_beatles, song_nirvana):
+    """Test fetching several songs by ID, skipping unknown IDs."""
+    songs = Songs.get_songs_by_ids([song_beatles.id, song_nirvana.id, 999])
+    assert sorted(song.id for song in songs) == [song_beatles.id, song_nirvana.id]
+
 
 def test_get_song_by_compound_key(song_nirvana):
     """Test fetching a song by compound key."""
     song = Songs.get_song_by_compound_key("Nirvana", "Smells Like Teen Spirit", 1991)
     assert song.genre == "Grunge"
 
-def test_get_song_by_compound_key_not_found(app):
+def test_get_song_by_compound_key_not_found(session):
     """Test error when fetching nonexistent song by compound key."""
     with pytest.raises(ValueError, match="not found"):
         Songs.get_song_by_compound_key("Ghost", "Invisible Song", 2024)
@@ -80,9 +85,9 @@ def test_get_song_by_compound_key_not_found(app):
 def test_delete_song_by_id(session, song_beatles):
     """Test deleting a song by ID."""
     Songs.delete_song(song_beatles.id)
-    assert session.query(Songs).get(song_beatles.id) is None
+    assert session.get(Songs, song_beatles.id) is None
 
-def test_delete_song_not_found(app):
+def test_delete_song_not_found(session):
     """Test deleting a non-existent song by ID."""
     with pytest.raises(ValueError, match="not found"):
         Songs.delete_song(999)
@@ -116,10 +121,15 @@ def test_get_all_songs_sorted(session, song_beatles, song_nirvana):
 
 # --- Random Song ---
 
-def test_get_random_song(session, song_beatles, song_nirvana):
+def test_get_random_song(session, song_beatles, song_nirvana, mocker):
     """Test getting a random song as a dictionary with expected fields."""
+    # Keep the test local: random.org is covered separately in test_api_utils
+    mock_get_random = mocker.patch("playlist.models.song_model.get_random", return_value=2)
+
     song = Songs.get_random_song()
 
+    mock_get_random.assert_called_once_with(2)
+
     assert isinstance(song, dict), "Expected a dictionary representing a song"
     assert set(song.keys()) == {"id", "artist", "title", "year", "genre", "duration", "play_count"}, \
         f"Unexpected keys in song dict: {song.keys()}"
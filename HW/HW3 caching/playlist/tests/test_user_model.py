@@ -1,3 +1,5 @@
+import hashlib
+
 import pytest
 
 from playlist.models.user_model import Users
@@ -25,8 +27,8 @@ def test_create_user(session, sample_user):
     user = session.query(Users).filter_by(username=sample_user["username"]).first()
     assert user is not None, "User should be created in the database."
     assert user.username == sample_user["username"], "Username should match the input."
-    assert len(user.salt) == 32, "Salt should be 32 characters (hex)."
-    assert len(user.password) == 64, "Password should be a 64-character SHA-256 hash."
+    assert user.salt is None, "Salt should be stored inside the Argon2 hash."
+    assert user.password.startswith("$argon2id$"), "Password should be an Argon2id hash."
 
 def test_create_duplicate_user(session, sample_user):
     """Test attempting to create a user with a duplicate username."""
@@ -48,6 +50,28 @@ def test_check_password_incorrect(session, sample_user):
     Users.create_user(**sample_user)
     assert Users.check_password(sample_user["username"], "wrongpassword") is False, "Password should not match."
 
+def test_authenticate(session, sample_user):
+    """Test that authenticate returns the user only for the correct password."""
+    Users.create_user(**sample_user)
+    user = Users.authenticate(sample_user["username"], sample_user["password"])
+    assert user is not None and user.username == sample_user["username"], "Authenticated user should be returned."
+    assert Users.authenticate(sample_user["username"], "wrongpassword") is None, "Wrong password should return None."
+
+def test_check_password_upgrades_legacy_hash(session, sample_user):
+    """Test that a legacy SHA-256 hash is replaced by an Argon2id hash on login."""
+    salt = "0" * 32
+    legacy_hash = hashlib.sha256((sample_user["password"] + salt).encode()).hexdigest()
+    session.add(Users(username=sample_user["username"], salt=salt, password=legacy_hash))
+    session.commit()
+
+    assert Users.check_password(sample_user["username"], "wrongpassword") is False, "Password should not match."
+    assert Users.check_password(sample_user["username"], sample_user["password"]) is True, "Password should match."
+
+    user = session.query(Users).filter_by(username=sample_user["username"]).first()
+    assert user.salt is None, "Legacy salt should be cleared after rehashing."
+    assert user.password.startswith("$argon2id$"), "Password should be rehashed with Argon2id."
+    assert Users.check_password(sample_user["username"], sample_user["password"]) is True, "Rehashed password should match."
+
 def test_check_password_user_not_found(session):
     """Test checking password for a non-existent user."""
     with pytest.raises(ValueError, match="User nonexistentuser not found"):
@@ -0,0 +1,13 @@
+"""WSGI entrypoint used by Gunicorn (see gunicorn.conf.py).
+
+gevent has to patch the standard library before anything else imports it, so
+that blocking socket I/O (database connections, requests calls to random.org)
+yields to other greenlets instead of stalling the whole worker.
+"""
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import create_app  # noqa: E402
+
+app = create_app()